@@ -9,11 +9,25 @@ __version__ = "1.0.0"
 __author__ = "Kiran Raj Baral"
 __email__ = "kneeraazon404@gmail.com"
 
-from .core.batch_processor import BatchProcessor
-from .core.document_converter import DocumentConverter
-from .core.docx_converter import DOCXConverter
-from .core.html_converter import HTMLConverter
-from .core.pdf_converter import PDFConverter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.batch_processor import BatchProcessor
+    from .core.document_converter import DocumentConverter
+    from .core.docx_converter import DOCXConverter
+    from .core.html_converter import HTMLConverter
+    from .core.pdf_converter import PDFConverter
+
+# Converters pull in heavy third-party backends, so they are only imported
+# when first accessed (PEP 562)
+_LAZY_IMPORTS = {
+    "BatchProcessor": ".core.batch_processor",
+    "DocumentConverter": ".core.document_converter",
+    "DOCXConverter": ".core.docx_converter",
+    "HTMLConverter": ".core.html_converter",
+    "PDFConverter": ".core.pdf_converter",
+}
 
 __all__ = [
     "DocumentConverter",
@@ -22,3 +36,18 @@ __all__ = [
     "HTMLConverter",
     "BatchProcessor",
 ]
+
+
+def __getattr__(name):
+    """Import converter classes on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
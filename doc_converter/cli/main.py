@@ -3,10 +3,11 @@ Command-line interface for document converter.
 """
 
 import argparse
+import contextlib
+import json
 import logging
 import sys
 
-from ..core.batch_processor import BatchProcessor
 from ..core.document_converter import DocumentConverter
 
 logger = logging.getLogger(__name__)
@@ -24,13 +25,22 @@ def setup_logging(level: str = "INFO"):
 def progress_callback(current: int, total: int, filename: str = ""):
     """Progress callback for batch operations."""
     percentage = (current / total) * 100
-    print(
-        f"\rProgress: {current}/{total} ({percentage:.1f}%) - {filename}",
-        end="",
-        flush=True,
-    )
+    line = f"\rProgress: {current}/{total} ({percentage:.1f}%) - {filename}"
     if current == total:
-        print()  # New line when complete
+        line += "\n"  # New line when complete
+
+    # One write and one flush per (rate-limited) update
+    sys.stdout.write(line)
+    sys.stdout.flush()
+
+
+def jsonl_result_sink(stream):
+    """Build a batch result sink that writes one JSON object per line."""
+
+    def sink(result):
+        stream.write(json.dumps(result) + "\n")
+
+    return sink
 
 
 def convert_pdf_to_images(args):
@@ -140,7 +150,13 @@ def convert_docx_to_html(args):
 
 def batch_convert(args):
     """Batch convert command."""
-    processor = BatchProcessor(max_workers=args.workers)
+    from ..core.batch_processor import BatchProcessor
+
+    processor = BatchProcessor(
+        max_workers=args.workers,
+        executor_type=args.executor,
+        use_cache=args.cache,
+    )
 
     try:
         print("🚀 Starting batch conversion...")
@@ -148,20 +164,32 @@ def batch_convert(args):
         print(f"📁 Output: {args.output_dir}")
         print(f"🎯 Target format: {args.format}")
 
-        results = processor.convert_directory(
-            input_dir=args.input_dir,
-            output_dir=args.output_dir,
-            target_format=args.format,
-            file_patterns=args.patterns,
-            recursive=args.recursive,
-            progress_callback=progress_callback,
-        )
+        with contextlib.ExitStack() as stack:
+            result_sink = None
+            if args.results_file:
+                results_stream = stack.enter_context(
+                    open(args.results_file, "w", encoding="utf-8")
+                )
+                result_sink = jsonl_result_sink(results_stream)
+
+            results = processor.convert_directory(
+                input_dir=args.input_dir,
+                output_dir=args.output_dir,
+                target_format=args.format,
+                file_patterns=args.patterns,
+                recursive=args.recursive,
+                progress_callback=progress_callback,
+                result_sink=result_sink,
+            )
 
         print("\n📊 Batch conversion completed:")
         print(f"   ✅ Successful: {results['successful']}")
         print(f"   ❌ Failed: {results['failed']}")
         print(f"   📈 Total: {results['total_files']}")
 
+        if args.results_file:
+            print(f"📝 Results written to: {args.results_file}")
+
         if results["errors"]:
             print("\n❌ Errors:")
             for error in results["errors"]:
@@ -285,7 +313,22 @@ Examples:
         "--recursive", "-r", action="store_true", help="Process subdirectories"
     )
     batch_parser.add_argument(
-        "--workers", "-w", type=int, default=4, help="Number of worker threads"
+        "--workers", "-w", type=int, default=4, help="Number of parallel workers"
+    )
+    batch_parser.add_argument(
+        "--executor",
+        choices=["auto", "thread", "process"],
+        default="auto",
+        help="Worker pool type (auto uses processes for image targets)",
+    )
+    batch_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip files already converted with the same content and options",
+    )
+    batch_parser.add_argument(
+        "--results-file",
+        help="Stream per-file results to this JSON Lines file",
     )
     batch_parser.set_defaults(func=batch_convert)
 
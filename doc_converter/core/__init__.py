@@ -2,11 +2,25 @@
 Core conversion modules.
 """
 
-from .batch_processor import BatchProcessor
-from .document_converter import DocumentConverter
-from .docx_converter import DOCXConverter
-from .html_converter import HTMLConverter
-from .pdf_converter import PDFConverter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .batch_processor import BatchProcessor
+    from .document_converter import DocumentConverter
+    from .docx_converter import DOCXConverter
+    from .html_converter import HTMLConverter
+    from .pdf_converter import PDFConverter
+
+# Converters pull in heavy third-party backends, so they are only imported
+# when first accessed (PEP 562)
+_LAZY_IMPORTS = {
+    "BatchProcessor": ".batch_processor",
+    "DocumentConverter": ".document_converter",
+    "DOCXConverter": ".docx_converter",
+    "HTMLConverter": ".html_converter",
+    "PDFConverter": ".pdf_converter",
+}
 
 __all__ = [
     "DocumentConverter",
@@ -15,3 +29,18 @@ __all__ = [
     "HTMLConverter",
     "BatchProcessor",
 ]
+
+
+def __getattr__(name):
+    """Import converter classes on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,416 @@
+"""
+Long-lived LibreOffice process driven over UNO.
+
+Starting LibreOffice dominates the cost of converting small documents, so
+instead of running ``soffice --convert-to`` once per file a single headless
+instance is kept per process and documents are exported through it.
+"""
+
+import logging
+import multiprocessing.util
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+except ImportError:  # LibreOffice's Python bindings are not importable
+    uno = None
+
+logger = logging.getLogger(__name__)
+
+_CONNECT_TIMEOUT = 30
+_CONNECT_INTERVAL = 0.25
+_SHUTDOWN_TIMEOUT = 10
+
+# PDF export filter for each document service, checked in order
+_PDF_FILTERS = (
+    ("com.sun.star.presentation.PresentationDocument", "impress_pdf_Export"),
+    ("com.sun.star.drawing.DrawingDocument", "draw_pdf_Export"),
+    ("com.sun.star.sheet.SpreadsheetDocument", "calc_pdf_Export"),
+    ("com.sun.star.text.TextDocument", "writer_pdf_Export"),
+)
+
+
+class _ExportTimeout(RuntimeError):
+    """An export took longer than its timeout and LibreOffice was killed."""
+
+
+_daemons: Dict[Tuple[int, str, Optional[int]], "SofficeDaemon"] = {}
+_daemons_lock = threading.Lock()
+
+
+def uno_available() -> bool:
+    """
+    Check whether LibreOffice's Python bindings can be used.
+
+    Returns:
+        True if the uno module was imported
+    """
+    return uno is not None
+
+
+def get_daemon(soffice_cmd: str, worker_id: Optional[int] = None) -> "SofficeDaemon":
+    """
+    Get the daemon for a LibreOffice executable in the current process.
+
+    Daemons are keyed by process ID so a forked worker never reuses the UNO
+    bridge of its parent. A daemon exports one document at a time, so each
+    batch worker slot gets its own LibreOffice instance and concurrent
+    workers don't queue behind one another. Each daemon is stopped when the
+    process exits.
+
+    Args:
+        soffice_cmd: LibreOffice executable
+        worker_id: Batch worker slot (optional, shared daemon when None)
+
+    Returns:
+        SofficeDaemon instance (not necessarily started)
+    """
+    key = (os.getpid(), soffice_cmd, worker_id)
+
+    with _daemons_lock:
+        daemon = _daemons.get(key)
+        if daemon is None:
+            daemon = SofficeDaemon(soffice_cmd)
+            _daemons[key] = daemon
+            # Finalizers with an exit priority run at interpreter exit and
+            # also when a multiprocessing worker shuts down, which skips
+            # plain atexit handlers
+            multiprocessing.util.Finalize(daemon, daemon.stop, exitpriority=0)
+
+    return daemon
+
+
+def _properties(**values: Any) -> Tuple[Any, ...]:
+    """
+    Build a UNO PropertyValue sequence.
+
+    Args:
+        **values: Property names and values
+
+    Returns:
+        Tuple of PropertyValue structs
+    """
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _file_url(path: Union[str, Path]) -> str:
+    """
+    Convert a filesystem path to a file:// URL.
+
+    Args:
+        path: File path
+
+    Returns:
+        Absolute file URL
+    """
+    return Path(os.path.abspath(path)).as_uri()
+
+
+class SofficeDaemon:
+    """
+    A headless LibreOffice instance accepting UNO connections on a private
+    pipe, restarted automatically if it dies.
+
+    LibreOffice is not thread-safe, so conversions through one daemon are
+    serialized.
+    """
+
+    def __init__(self, soffice_cmd: str):
+        """
+        Initialize the daemon without starting LibreOffice.
+
+        Args:
+            soffice_cmd: LibreOffice executable
+        """
+        self.soffice_cmd = soffice_cmd
+        self._pipe_name = f"doc_converter_{os.getpid()}_{id(self):x}"
+        self._process: Optional[subprocess.Popen] = None
+        self._desktop: Any = None
+        self._profile_dir: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def is_alive(self) -> bool:
+        """
+        Check whether the LibreOffice process is running.
+
+        Returns:
+            True if the process has been started and has not exited
+        """
+        return self._process is not None and self._process.poll() is None
+
+    def ensure_running(self) -> None:
+        """
+        Start LibreOffice if it is not running.
+
+        Raises:
+            RuntimeError: If the UNO bindings are missing or LibreOffice
+                cannot be started
+        """
+        with self._lock:
+            if not self.is_alive():
+                self._restart()
+
+    def convert_to_pdf(
+        self,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Export a document to PDF.
+
+        If LibreOffice crashes during the export it is restarted and the
+        document is tried once more. If it takes longer than ``timeout``,
+        LibreOffice is killed and restarted for the next document.
+
+        Args:
+            input_path: Path to the input document
+            output_path: Path for the output PDF file
+            timeout: Seconds to wait for one export (optional, no limit)
+
+        Raises:
+            RuntimeError: If LibreOffice cannot be started, cannot open the
+                document or times out
+        """
+        with self._lock:
+            if not self.is_alive():
+                if self._process is not None:
+                    logger.warning("LibreOffice daemon exited, restarting")
+                self._restart()
+
+            try:
+                self._export_pdf_within(input_path, output_path, timeout)
+            except _ExportTimeout:
+                raise
+            except Exception:
+                if self.is_alive():
+                    raise
+                logger.warning(
+                    "LibreOffice daemon crashed converting %s, restarting", input_path
+                )
+                self._restart()
+                self._export_pdf_within(input_path, output_path, timeout)
+
+    def stop(self) -> None:
+        """
+        Shut down LibreOffice and remove its temporary profile.
+        """
+        with self._lock:
+            self._shutdown()
+
+    def _restart(self) -> None:
+        """
+        (Re)start LibreOffice and connect to it. Caller holds the lock.
+        """
+        if uno is None:
+            raise RuntimeError("LibreOffice UNO bindings are not available")
+
+        self._shutdown()
+
+        # A private profile avoids clashing with a desktop LibreOffice session
+        self._profile_dir = tempfile.mkdtemp(prefix="doc_converter_lo_")
+        cmd = [
+            self.soffice_cmd,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nodefault",
+            "--norestore",
+            "--nofirststartwizard",
+            f"-env:UserInstallation={Path(self._profile_dir).as_uri()}",
+            f"--accept=pipe,name={self._pipe_name};urp;StarOffice.ComponentContext",
+        ]
+
+        logger.info("Starting LibreOffice daemon: %s", self.soffice_cmd)
+        self._process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        try:
+            self._desktop = self._connect()
+        except Exception:
+            self._shutdown()
+            raise
+
+    def _connect(self) -> Any:
+        """
+        Wait for LibreOffice to accept connections and get its Desktop.
+
+        Returns:
+            com.sun.star.frame.Desktop proxy
+
+        Raises:
+            RuntimeError: If LibreOffice exits or does not accept in time
+        """
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        url = f"uno:pipe,name={self._pipe_name};urp;StarOffice.ComponentContext"
+
+        deadline = time.monotonic() + _CONNECT_TIMEOUT
+        while True:
+            returncode = self._process.poll()
+            if returncode is not None:
+                raise RuntimeError(
+                    f"LibreOffice exited during startup with code {returncode}"
+                )
+
+            try:
+                context = resolver.resolve(url)
+                break
+            except NoConnectException:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"LibreOffice did not accept connections within "
+                        f"{_CONNECT_TIMEOUT} seconds"
+                    )
+                time.sleep(_CONNECT_INTERVAL)
+
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def _export_pdf_within(
+        self,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        timeout: Optional[float],
+    ) -> None:
+        """
+        Export a document to PDF, killing LibreOffice if it takes too long.
+        Caller holds the lock.
+
+        Args:
+            input_path: Path to the input document
+            output_path: Path for the output PDF file
+            timeout: Seconds to wait for the export (None for no limit)
+
+        Raises:
+            _ExportTimeout: If the export timed out; LibreOffice has been
+                restarted
+        """
+        if timeout is None:
+            self._export_pdf(input_path, output_path)
+            return
+
+        # A hung export never returns over UNO, so a watchdog kills the
+        # process, which makes the pending call fail
+        process = self._process
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            self._export_pdf(input_path, output_path)
+        except Exception:
+            watchdog.cancel()
+            if timed_out.is_set():
+                self._restart_after_timeout(input_path, timeout)
+            raise
+        watchdog.cancel()
+
+        # The export may have returned just as the watchdog fired
+        if timed_out.is_set():
+            self._restart_after_timeout(input_path, timeout)
+
+    def _restart_after_timeout(
+        self, input_path: Union[str, Path], timeout: float
+    ) -> None:
+        """
+        Restart LibreOffice after the watchdog killed it. Caller holds the
+        lock.
+
+        Args:
+            input_path: Path to the document that timed out
+            timeout: The timeout that was exceeded, in seconds
+
+        Raises:
+            _ExportTimeout: Always, once LibreOffice has been restarted
+        """
+        logger.error("LibreOffice timed out converting %s, restarting", input_path)
+        try:
+            self._restart()
+        except Exception as e:
+            logger.warning("Failed to restart LibreOffice daemon: %s", e)
+        raise _ExportTimeout(
+            f"Conversion timed out after {timeout:g} seconds: {input_path}"
+        )
+
+    def _export_pdf(
+        self, input_path: Union[str, Path], output_path: Union[str, Path]
+    ) -> None:
+        """
+        Load a document, store it as PDF and close it. Caller holds the lock.
+
+        Args:
+            input_path: Path to the input document
+            output_path: Path for the output PDF file
+        """
+        document = self._desktop.loadComponentFromURL(
+            _file_url(input_path), "_blank", 0, _properties(Hidden=True)
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not open: {input_path}")
+
+        try:
+            filter_name = next(
+                (
+                    name
+                    for service, name in _PDF_FILTERS
+                    if document.supportsService(service)
+                ),
+                "writer_pdf_Export",
+            )
+            document.storeToURL(
+                _file_url(output_path), _properties(FilterName=filter_name)
+            )
+        finally:
+            document.close(True)
+
+    def _shutdown(self) -> None:
+        """
+        Terminate LibreOffice if running. Caller holds the lock.
+        """
+        terminated = False
+        if self._desktop is not None:
+            try:
+                terminated = self._desktop.terminate()
+            except Exception:
+                # The bridge is already gone if LibreOffice crashed
+                pass
+            self._desktop = None
+
+        if self._process is not None:
+            if not terminated and self._process.poll() is None:
+                self._process.terminate()
+            try:
+                self._process.wait(timeout=_SHUTDOWN_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
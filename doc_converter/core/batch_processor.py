@@ -2,35 +2,379 @@
 Batch processing utilities for handling multiple file conversions.
 """
 
+import functools
+import itertools
 import logging
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import queue
+import sqlite3
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
+from ..utils.cache import ConversionCache
+from ..utils.file_handler import FileHandler, _compile_patterns
 from .document_converter import DocumentConverter
 
 logger = logging.getLogger(__name__)
 
+EXECUTOR_TYPES = ("auto", "thread", "process")
+
+# Image target formats; conversions to these produce one file per page
+_IMAGE_FORMATS = ("jpeg", "png")
+
+# Target formats whose conversion is CPU-bound (PDF rasterization) and
+# therefore benefits from running in separate processes.
+_PROCESS_BOUND_FORMATS = _IMAGE_FORMATS
+
+# (input extension, target format) -> DocumentConverter method
+_DISPATCH = {
+    ("docx", "pdf"): "docx_to_pdf",
+    ("pptx", "pdf"): "pptx_to_pdf",
+    ("txt", "pdf"): "txt_to_pdf",
+    ("html", "pdf"): "html_to_pdf",
+    ("docx", "html"): "docx_to_html",
+    ("pdf", "jpeg"): "pdf_to_images",
+    ("pdf", "png"): "pdf_to_images",
+}
+
+# Configuration sections whose settings change what a conversion writes;
+# they are part of every conversion cache key
+_CACHE_KEY_SECTIONS = ("output", "libreoffice", "wkhtmltopdf")
+
+# Conversions that run LibreOffice and accept a worker slot for its profile
+_LIBREOFFICE_METHODS = frozenset({"docx_to_pdf", "pptx_to_pdf"})
+
+# In-flight futures allowed per worker before submission waits
+_SUBMIT_WINDOW_FACTOR = 4
+
+# Minimum number of seconds between progress callbacks (at most 20 per second)
+_PROGRESS_INTERVAL = 0.05
+
+# Worker slot of the current pool process, assigned by _init_worker
+_worker_id: Optional[int] = None
+
+
+def _relative_path(entry: os.DirEntry, directory: Path) -> str:
+    """
+    Get an entry's path relative to the walk root, with '/' separators.
+
+    Args:
+        entry: Directory entry
+        directory: Directory the walk started from
+
+    Returns:
+        Relative path usable for glob-style matching
+    """
+    relative = os.path.relpath(entry.path, directory)
+    return relative.replace(os.sep, "/") if os.sep != "/" else relative
+
+
+def _is_extension_pattern(pattern: str) -> bool:
+    """
+    Check whether a pattern only matches on a single file extension.
+
+    Args:
+        pattern: Glob-style pattern
+
+    Returns:
+        True for patterns of the form '*.ext'
+    """
+    return pattern.startswith("*.") and not any(c in pattern[2:] for c in "*?[/.")
+
+
+def _largest_first(files: List[Path]) -> List[Path]:
+    """
+    Order files by size, largest first.
+
+    Args:
+        files: Files to order
+
+    Returns:
+        New list of files sorted by descending size
+    """
+    sized = []
+    for path in files:
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            size = 0
+        sized.append((size, path))
+
+    sized.sort(key=lambda item: item[0], reverse=True)
+    return [path for _, path in sized]
+
+
+def _input_extension(input_file: Path) -> str:
+    """
+    Get the normalized extension used to look up a conversion.
+
+    Args:
+        input_file: Input file path
+
+    Returns:
+        Lowercase extension without the leading dot
+    """
+    return input_file.suffix.lower().lstrip(".")
+
+
+def _convert_file(
+    converter: DocumentConverter,
+    input_file: Path,
+    output_dir: Path,
+    target_format: str,
+    cache: Optional[ConversionCache] = None,
+    worker_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Convert a single file, reusing an earlier identical conversion if cached.
+
+    A cached conversion is only reused for the same input content, target,
+    output directory and output, LibreOffice and wkhtmltopdf settings.
+
+    Args:
+        converter: DocumentConverter used for the conversion
+        input_file: Input file path
+        output_dir: Output directory
+        target_format: Target format
+        cache: Conversion cache to consult and update (optional)
+        worker_id: Worker slot passed on to LibreOffice conversions (optional)
+
+    Returns:
+        Conversion result information
+
+    Raises:
+        ValueError: If the file cannot be converted to the target format
+        Exception: If conversion fails
+    """
+    if cache is None:
+        return _run_conversion(
+            converter, input_file, output_dir, target_format, worker_id
+        )
+
+    try:
+        cache_key = cache.key(
+            input_file,
+            target_format,
+            output_dir=os.path.abspath(output_dir),
+            **{
+                section: converter.config.get(section, {})
+                for section in _CACHE_KEY_SECTIONS
+            },
+        )
+        result = cache.get(cache_key)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Conversion cache unavailable for %s: %s", input_file.name, e)
+        return _run_conversion(
+            converter, input_file, output_dir, target_format, worker_id
+        )
+
+    if result is not None:
+        logger.info("Using cached conversion: %s", input_file.name)
+        return result
+
+    result = _run_conversion(
+        converter, input_file, output_dir, target_format, worker_id
+    )
+
+    outputs = result.get("output_files") or [result["output_file"]]
+    try:
+        cache.put(cache_key, result, outputs)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to cache conversion of %s: %s", input_file.name, e)
+
+    return result
+
+
+def _run_conversion(
+    converter: DocumentConverter,
+    input_file: Path,
+    output_dir: Path,
+    target_format: str,
+    worker_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Convert a single file to the target format with the given converter.
+
+    Args:
+        converter: DocumentConverter used for the conversion
+        input_file: Input file path
+        output_dir: Output directory
+        target_format: Target format
+        worker_id: Worker slot passed on to LibreOffice conversions (optional)
+
+    Returns:
+        Conversion result information
+
+    Raises:
+        ValueError: If the file cannot be converted to the target format
+        Exception: If conversion fails
+    """
+    input_ext = _input_extension(input_file)
+    method_name = _DISPATCH.get((input_ext, target_format))
+
+    if method_name is None:
+        raise ValueError(f"Cannot convert {input_ext} to {target_format}")
+
+    convert = getattr(converter, method_name)
+
+    if target_format in _IMAGE_FORMATS:
+        # For image formats, create subdirectory for each file
+        file_output_dir = output_dir / f"{input_file.stem}_images"
+        FileHandler.ensure_directory_cached(file_output_dir)
+
+        output_files = convert(input_file, file_output_dir, target_format)
+        return {
+            "input_file": str(input_file),
+            "output_files": output_files,
+            "format": target_format,
+            "type": "multiple_images",
+        }
+
+    # Single file output; html_to_pdf expects its source as a string
+    output_file = output_dir / f"{input_file.stem}.{target_format}"
+    if worker_id is not None and method_name in _LIBREOFFICE_METHODS:
+        result_path = convert(str(input_file), output_file, worker_id=worker_id)
+    else:
+        result_path = convert(str(input_file), output_file)
+
+    return {
+        "input_file": str(input_file),
+        "output_file": result_path,
+        "format": target_format,
+        "type": "single_file",
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(config_path=None) -> DocumentConverter:
+    """
+    Get a DocumentConverter for a configuration, reusing earlier instances.
+
+    Args:
+        config_path: Path to configuration file (optional)
+
+    Returns:
+        Cached DocumentConverter instance
+    """
+    return DocumentConverter(config_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_cache(cache_path: Optional[str]) -> Optional[ConversionCache]:
+    """
+    Get this process's connection to a conversion cache.
+
+    Args:
+        cache_path: Path to the cache index, or None when caching is disabled
+
+    Returns:
+        Cached ConversionCache instance, or None
+    """
+    return ConversionCache(cache_path) if cache_path else None
+
+
+def _init_worker(
+    config_path=None,
+    cache_path: Optional[str] = None,
+    worker_ids: Optional["multiprocessing.Queue[int]"] = None,
+) -> None:
+    """
+    Warm the converter and cache connections when a worker process starts.
+
+    Args:
+        config_path: Path to configuration file (optional)
+        cache_path: Path to the conversion cache index (optional)
+        worker_ids: Queue of free worker slots; this process claims one
+            for the rest of its life (optional)
+    """
+    global _worker_id
+    if worker_ids is not None:
+        _worker_id = worker_ids.get()
+
+    # The pool already converts one file per worker; splitting each PDF
+    # across more processes would start max_workers x CPU count of them
+    _get_converter(config_path).pdf_converter.thread_count = 1
+    _get_cache(cache_path)
+
+
+def _convert_single_file_worker(
+    input_file: Path,
+    output_dir: Path,
+    target_format: str,
+    config_path=None,
+    cache_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Convert a single file inside a worker process.
+
+    Converters hold state that cannot be pickled, so each worker process
+    builds its own DocumentConverter from the configuration path and
+    reuses it for every file it handles.
+
+    Args:
+        input_file: Input file path
+        output_dir: Output directory
+        target_format: Target format
+        config_path: Path to configuration file (optional)
+        cache_path: Path to the conversion cache index (optional)
+
+    Returns:
+        Conversion result information
+    """
+    converter = _get_converter(config_path)
+    cache = _get_cache(cache_path)
+    return _convert_file(
+        converter, input_file, output_dir, target_format, cache, _worker_id
+    )
+
 
 class BatchProcessor:
     """
     Handles batch conversion operations with progress tracking and parallel processing.
     """
 
-    def __init__(self, config=None, max_workers: int = 4):
+    def __init__(
+        self,
+        config=None,
+        max_workers: int = 4,
+        executor_type: str = "auto",
+        use_cache: bool = False,
+        cache_path: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize batch processor.
 
         Args:
             config: Configuration object (optional)
-            max_workers: Maximum number of worker threads for parallel processing
+            max_workers: Maximum number of workers for parallel processing
+            executor_type: 'thread', 'process', or 'auto' to use processes
+                for CPU-bound image targets and threads otherwise
+            use_cache: Skip files whose identical conversion is already cached
+            cache_path: Location of the cache index (defaults to
+                ~/.cache/doc_converter/index.sqlite)
+
+        Raises:
+            ValueError: If executor_type is not recognised
         """
+        if executor_type not in EXECUTOR_TYPES:
+            raise ValueError(f"Unsupported executor type: {executor_type}")
+
         self.config = config
         self.max_workers = max_workers
+        self.executor_type = executor_type
         self.converter = DocumentConverter(config)
-        self._progress_lock = threading.Lock()
-        logger.info(f"BatchProcessor initialized with {max_workers} workers")
+        self.cache = ConversionCache(cache_path) if use_cache else None
+        logger.info("BatchProcessor initialized with %d workers", max_workers)
 
     def convert_directory(
         self,
@@ -40,6 +384,7 @@ class BatchProcessor:
         file_patterns: Optional[List[str]] = None,
         recursive: bool = True,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        result_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Convert all supported files in a directory to target format.
@@ -50,7 +395,10 @@ class BatchProcessor:
             target_format: Target format ('pdf', 'html', 'jpeg', 'png')
             file_patterns: File patterns to include (e.g., ['*.docx', '*.pdf'])
             recursive: Whether to process subdirectories
-            progress_callback: Callback function for progress updates (current, total, filename)
+            progress_callback: Callback function for progress updates (current, total, filename),
+                called from the calling thread at most 20 times a second
+            result_sink: Callback receiving each successful result; when given,
+                results are streamed to it instead of collected in 'results'
 
         Returns:
             Dictionary with conversion results and statistics
@@ -64,11 +412,25 @@ class BatchProcessor:
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Starting batch conversion: {input_dir} -> {output_dir}")
-        logger.info(f"Target format: {target_format}")
+        logger.info("Starting batch conversion: %s -> %s", input_dir, output_dir)
+        logger.info("Target format: %s", target_format)
 
-        # Find all files to process
-        files_to_process = self._find_files(input_dir, file_patterns, recursive)
+        # Find all files to process, dropping those that cannot be
+        # converted before they reach a worker
+        files_to_process = []
+        skipped = []
+        for file_path in self._find_files(input_dir, file_patterns, recursive):
+            if (_input_extension(file_path), target_format) in _DISPATCH:
+                files_to_process.append(file_path)
+            else:
+                skipped.append(file_path)
+
+        if skipped:
+            logger.warning(
+                "Skipping %d files that cannot be converted to %s",
+                len(skipped),
+                target_format,
+            )
 
         if not files_to_process:
             logger.warning("No files found to process")
@@ -80,11 +442,15 @@ class BatchProcessor:
                 "errors": [],
             }
 
-        logger.info(f"Found {len(files_to_process)} files to process")
+        logger.info("Found %d files to process", len(files_to_process))
 
         # Process files
         return self._process_files_parallel(
-            files_to_process, output_dir, target_format, progress_callback
+            files_to_process,
+            output_dir,
+            target_format,
+            progress_callback,
+            result_sink,
         )
 
     def convert_file_list(
@@ -93,6 +459,7 @@ class BatchProcessor:
         output_dir: Union[str, Path],
         target_format: str,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        result_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Convert a specific list of files to target format.
@@ -101,7 +468,9 @@ class BatchProcessor:
             file_list: List of file paths to convert
             output_dir: Directory for output files
             target_format: Target format ('pdf', 'html', 'jpeg', 'png')
-            progress_callback: Callback function for progress updates
+            progress_callback: Callback function for progress updates,
+                called from the calling thread at most 20 times a second
+            result_sink: Callback receiving each successful result (optional)
 
         Returns:
             Dictionary with conversion results and statistics
@@ -114,12 +483,16 @@ class BatchProcessor:
 
         if len(existing_files) != len(file_list):
             missing_files = set(file_list) - set(str(f) for f in existing_files)
-            logger.warning(f"Some files not found: {missing_files}")
+            logger.warning("Some files not found: %s", missing_files)
 
-        logger.info(f"Processing {len(existing_files)} files")
+        logger.info("Processing %d files", len(existing_files))
 
         return self._process_files_parallel(
-            existing_files, output_dir, target_format, progress_callback
+            existing_files,
+            output_dir,
+            target_format,
+            progress_callback,
+            result_sink,
         )
 
     def _find_files(
@@ -140,18 +513,46 @@ class BatchProcessor:
             # Default supported extensions
             patterns = ["*.pdf", "*.docx", "*.pptx", "*.txt", "*.html"]
 
-        files = []
-
+        # Plain "*.ext" patterns become one set lookup on the lowercased
+        # extension; the rest are compiled into a single regex for names
+        # and one for relative paths
+        extensions = frozenset(
+            pattern[2:].lower()
+            for pattern in patterns
+            if _is_extension_pattern(pattern)
+        )
+        name_patterns = []
+        path_patterns = []
         for pattern in patterns:
-            if recursive:
-                files.extend(directory.rglob(pattern))
+            if _is_extension_pattern(pattern):
+                continue
+            if "/" in pattern:
+                path_patterns.append(pattern)
+                if recursive:
+                    path_patterns.append("*/" + pattern)
             else:
-                files.extend(directory.glob(pattern))
+                name_patterns.append(pattern)
 
-        # Remove duplicates and sort
-        files = sorted(list(set(files)))
+        name_regex = _compile_patterns(name_patterns)
+        path_regex = _compile_patterns(path_patterns)
 
-        logger.info(f"Found {len(files)} files matching patterns: {patterns}")
+        # Walk the tree once, matching every entry against all patterns
+        files = []
+        for entry in FileHandler.walk_files(directory, recursive):
+            name = entry.name
+            _, dot, extension = name.rpartition(".")
+            if (dot and extension.lower() in extensions) or (
+                name_regex is not None and name_regex.match(name)
+            ):
+                files.append(Path(entry.path))
+            elif path_regex is not None and path_regex.match(
+                _relative_path(entry, directory)
+            ):
+                files.append(Path(entry.path))
+
+        files.sort()
+
+        logger.info("Found %d files matching patterns: %s", len(files), patterns)
         return files
 
     def _process_files_parallel(
@@ -160,15 +561,17 @@ class BatchProcessor:
         output_dir: Path,
         target_format: str,
         progress_callback: Optional[Callable[[int, int, str], None]],
+        result_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
-        Process files in parallel using ThreadPoolExecutor.
+        Process files in parallel using a thread or process pool.
 
         Args:
             files: List of files to process
             output_dir: Output directory
             target_format: Target format
             progress_callback: Progress callback function
+            result_sink: Callback receiving each successful result (optional)
 
         Returns:
             Processing results
@@ -181,56 +584,164 @@ class BatchProcessor:
             "errors": [],
         }
 
-        completed_count = 0
+        # Completions are counted here, in the thread collecting futures,
+        # rather than in the workers: the count is then the same for thread
+        # and process pools and needs no shared memory or locking
+        total = len(files)
+        completed_counter = itertools.count(1)
+        last_emit = 0.0
 
         def update_progress(filename: str = ""):
-            nonlocal completed_count
-            with self._progress_lock:
-                completed_count += 1
-                if progress_callback:
-                    progress_callback(completed_count, len(files), filename)
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(
+            nonlocal last_emit
+            completed = next(completed_counter)
+            if not progress_callback:
+                return
+
+            # Rate-limit callbacks; the final update is always delivered
+            now = time.monotonic()
+            if completed == total or now - last_emit >= _PROGRESS_INTERVAL:
+                last_emit = now
+                progress_callback(completed, total, filename)
+
+        # Start the largest files first so a big document submitted last
+        # doesn't hold up the end of the batch on a single worker
+        files = _largest_first(files)
+
+        use_processes = self._use_processes(target_format)
+
+        # Only keep a bounded number of futures in flight so huge batches
+        # don't materialize a future per file up front
+        window = _SUBMIT_WINDOW_FACTOR * self.max_workers
+        remaining = iter(files)
+
+        # Thread workers borrow a slot for each file they convert; process
+        # workers each claim one when they start
+        worker_ids: Optional["queue.Queue[int]"] = None
+        if not use_processes:
+            worker_ids = queue.Queue()
+            for worker_id in range(self.max_workers):
+                worker_ids.put(worker_id)
+
+        with self._create_executor(use_processes) as executor:
+
+            def submit(file_path: Path) -> Future:
+                # Ask the OS to read the input ahead of the worker
+                FileHandler.prefetch(file_path)
+                if use_processes:
+                    return executor.submit(
+                        _convert_single_file_worker,
+                        file_path,
+                        output_dir,
+                        target_format,
+                        self.config,
+                        self._cache_path(),
+                    )
+                return executor.submit(
                     self._convert_single_file,
                     file_path,
                     output_dir,
                     target_format,
-                ): file_path
-                for file_path in files
-            }
-
-            # Process completed tasks
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-
-                try:
-                    result = future.result()
-                    results["successful"] += 1
-                    results["results"].append(result)
-                    logger.info(f"Successfully processed: {file_path.name}")
+                    worker_ids,
+                )
 
-                except Exception as e:
-                    error_info = {"file": str(file_path), "error": str(e)}
-                    results["failed"] += 1
-                    results["errors"].append(error_info)
-                    logger.error(f"Failed to process {file_path.name}: {e}")
+            future_to_file = {
+                submit(file_path): file_path
+                for file_path in itertools.islice(remaining, window)
+            }
 
-                finally:
-                    update_progress(file_path.name)
+            try:
+                # Process completed tasks, topping the window back up
+                while future_to_file:
+                    done, _ = wait(future_to_file, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        file_path = future_to_file.pop(future)
+
+                        try:
+                            result = future.result()
+
+                        except Exception as e:
+                            error_info = {"file": str(file_path), "error": str(e)}
+                            results["failed"] += 1
+                            results["errors"].append(error_info)
+                            logger.error("Failed to process %s: %s", file_path.name, e)
+
+                        else:
+                            results["successful"] += 1
+                            # Hand results off as they arrive so large batches
+                            # don't have to keep every result in memory
+                            if result_sink:
+                                result_sink(result)
+                            else:
+                                results["results"].append(result)
+                            logger.info("Successfully processed: %s", file_path.name)
+
+                        finally:
+                            update_progress(file_path.name)
+
+                        next_file = next(remaining, None)
+                        if next_file is not None:
+                            future_to_file[submit(next_file)] = next_file
+
+            except KeyboardInterrupt:
+                # Drop queued work so shutdown only waits for running files
+                logger.warning("Batch interrupted, cancelling pending conversions")
+                for future in future_to_file:
+                    future.cancel()
+                raise
 
         logger.info(
-            f"Batch processing completed: "
-            f"{results['successful']} successful, {results['failed']} failed"
+            "Batch processing completed: %d successful, %d failed",
+            results["successful"],
+            results["failed"],
         )
 
         return results
 
+    def _use_processes(self, target_format: str) -> bool:
+        """
+        Decide whether a batch should run in a process pool.
+
+        Args:
+            target_format: Target format
+
+        Returns:
+            True if a ProcessPoolExecutor should be used
+        """
+        if self.executor_type == "auto":
+            return target_format in _PROCESS_BOUND_FORMATS
+        return self.executor_type == "process"
+
+    def _create_executor(self, use_processes: bool) -> Executor:
+        """
+        Create the executor used to run conversions.
+
+        Args:
+            use_processes: Whether to use processes instead of threads
+
+        Returns:
+            Executor instance
+        """
+        if use_processes:
+            logger.info("Using process pool with %d workers", self.max_workers)
+            worker_ids: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+            for worker_id in range(self.max_workers):
+                worker_ids.put(worker_id)
+
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.config, self._cache_path(), worker_ids),
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
     def _convert_single_file(
-        self, input_file: Path, output_dir: Path, target_format: str
-    ) -> Dict[str, str]:
+        self,
+        input_file: Path,
+        output_dir: Path,
+        target_format: str,
+        worker_ids: Optional["queue.Queue[int]"] = None,
+    ) -> Dict[str, Any]:
         """
         Convert a single file to the target format.
 
@@ -238,6 +749,8 @@ class BatchProcessor:
             input_file: Input file path
             output_dir: Output directory
             target_format: Target format
+            worker_ids: Queue of free worker slots; one is held for the
+                duration of the conversion (optional)
 
         Returns:
             Conversion result information
@@ -245,57 +758,29 @@ class BatchProcessor:
         Raises:
             Exception: If conversion fails
         """
-        input_ext = input_file.suffix.lower().lstrip(".")
-
-        # Determine output filename
-        if target_format in ["jpeg", "png"]:
-            # For image formats, create subdirectory for each file
-            file_output_dir = output_dir / f"{input_file.stem}_images"
-            file_output_dir.mkdir(parents=True, exist_ok=True)
-
-            if input_ext == "pdf":
-                output_files = self.converter.pdf_to_images(
-                    input_file, file_output_dir, target_format
-                )
-                return {
-                    "input_file": str(input_file),
-                    "output_files": output_files,
-                    "format": target_format,
-                    "type": "multiple_images",
-                }
-            else:
-                raise ValueError(f"Cannot convert {input_ext} to {target_format}")
-
-        else:
-            # Single file output
-            output_file = output_dir / f"{input_file.stem}.{target_format}"
-
-            if target_format == "pdf":
-                if input_ext == "docx":
-                    result_path = self.converter.docx_to_pdf(input_file, output_file)
-                elif input_ext == "pptx":
-                    result_path = self.converter.pptx_to_pdf(input_file, output_file)
-                elif input_ext == "txt":
-                    result_path = self.converter.txt_to_pdf(input_file, output_file)
-                elif input_ext == "html":
-                    result_path = self.converter.html_to_pdf(
-                        str(input_file), output_file
-                    )
-                else:
-                    raise ValueError(f"Cannot convert {input_ext} to PDF")
-
-            elif target_format == "html":
-                if input_ext == "docx":
-                    result_path = self.converter.docx_to_html(input_file, output_file)
-                else:
-                    raise ValueError(f"Cannot convert {input_ext} to HTML")
-
-            else:
-                raise ValueError(f"Unsupported target format: {target_format}")
+        if worker_ids is None:
+            return _convert_file(
+                self.converter, input_file, output_dir, target_format, self.cache
+            )
+
+        worker_id = worker_ids.get()
+        try:
+            return _convert_file(
+                self.converter,
+                input_file,
+                output_dir,
+                target_format,
+                self.cache,
+                worker_id,
+            )
+        finally:
+            worker_ids.put(worker_id)
+
+    def _cache_path(self) -> Optional[str]:
+        """
+        Get the cache index path handed to worker processes.
 
-            return {
-                "input_file": str(input_file),
-                "output_file": result_path,
-                "format": target_format,
-                "type": "single_file",
-            }
+        Returns:
+            Path to the cache index, or None when caching is disabled
+        """
+        return str(self.cache.db_path) if self.cache else None
@@ -76,7 +76,7 @@ class DocumentConverter:
         else:
             output_dir = Path(output_dir)
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        FileHandler.ensure_directory(output_dir)
 
         return self.pdf_converter.to_images(pdf_path, output_dir, format, dpi)
 
@@ -84,6 +84,7 @@ class DocumentConverter:
         self,
         docx_path: Union[str, Path],
         output_path: Optional[Union[str, Path]] = None,
+        worker_id: Optional[int] = None,
     ) -> str:
         """
         Convert DOCX file to PDF.
@@ -91,6 +92,8 @@ class DocumentConverter:
         Args:
             docx_path: Path to the DOCX file
             output_path: Output PDF path (optional)
+            worker_id: Batch worker slot, used to give concurrent LibreOffice
+                runs separate daemons or profiles (optional)
 
         Returns:
             Path to the created PDF file
@@ -108,14 +111,15 @@ class DocumentConverter:
         else:
             output_path = Path(output_path)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        FileHandler.ensure_directory(output_path.parent)
 
-        return self.docx_converter.to_pdf(docx_path, output_path)
+        return self.docx_converter.to_pdf(docx_path, output_path, worker_id)
 
     def pptx_to_pdf(
         self,
         pptx_path: Union[str, Path],
         output_path: Optional[Union[str, Path]] = None,
+        worker_id: Optional[int] = None,
     ) -> str:
         """
         Convert PPTX file to PDF.
@@ -123,6 +127,8 @@ class DocumentConverter:
         Args:
             pptx_path: Path to the PPTX file
             output_path: Output PDF path (optional)
+            worker_id: Batch worker slot, used to give concurrent LibreOffice
+                runs separate daemons or profiles (optional)
 
         Returns:
             Path to the created PDF file
@@ -140,10 +146,10 @@ class DocumentConverter:
         else:
             output_path = Path(output_path)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        FileHandler.ensure_directory(output_path.parent)
 
         return self.docx_converter.to_pdf(
-            pptx_path, output_path
+            pptx_path, output_path, worker_id
         )  # LibreOffice handles PPTX
 
     def txt_to_pdf(
@@ -162,19 +168,17 @@ class DocumentConverter:
             Path to the created PDF file
 
         Raises:
-            FileNotFoundError: If TXT file doesn't exist
+            FileNotFoundError: If TXT file doesn't exist (raised when the
+                converter opens it)
         """
         txt_path = Path(txt_path)
 
-        if not txt_path.exists():
-            raise FileNotFoundError(f"TXT file not found: {txt_path}")
-
         if output_path is None:
             output_path = txt_path.parent / f"{txt_path.stem}.pdf"
         else:
             output_path = Path(output_path)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        FileHandler.ensure_directory(output_path.parent)
 
         return self.docx_converter.txt_to_pdf(txt_path, output_path)
 
@@ -196,7 +200,7 @@ class DocumentConverter:
             Path to the created PDF file
         """
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        FileHandler.ensure_directory(output_path.parent)
 
         return self.html_converter.to_pdf(html_source, output_path, options)
 
@@ -216,19 +220,17 @@ class DocumentConverter:
             Path to the created HTML file
 
         Raises:
-            FileNotFoundError: If DOCX file doesn't exist
+            FileNotFoundError: If DOCX file doesn't exist (raised when the
+                converter opens it)
         """
         docx_path = Path(docx_path)
 
-        if not docx_path.exists():
-            raise FileNotFoundError(f"DOCX file not found: {docx_path}")
-
         if output_path is None:
             output_path = docx_path.parent / f"{docx_path.stem}.html"
         else:
             output_path = Path(output_path)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        FileHandler.ensure_directory(output_path.parent)
 
         return self.docx_converter.to_html(docx_path, output_path)
 
@@ -2,15 +2,136 @@
 HTML conversion utilities for converting HTML to PDF.
 """
 
+import asyncio
+import functools
 import logging
 import os
+import shutil
+import subprocess
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
-import pdfkit
+from ..utils.file_handler import FileHandler
 
+# pdfkit is imported where it is used, so importing the package does not
+# pay for loading it
 logger = logging.getLogger(__name__)
 
+_WKHTMLTOPDF_PATHS = (
+    "/usr/bin/wkhtmltopdf",
+    "/usr/local/bin/wkhtmltopdf",
+    "C:\\Program Files\\wkhtmltopdf\\bin\\wkhtmltopdf.exe",
+    "C:\\Program Files (x86)\\wkhtmltopdf\\bin\\wkhtmltopdf.exe",
+)
+
+# Default wkhtmltopdf options for HTML strings. They are read-only, so a
+# call without overrides can pass them on without copying.
+_STRING_OPTIONS = MappingProxyType(
+    {
+        "page-size": "A4",
+        "margin-top": "0.75in",
+        "margin-right": "0.75in",
+        "margin-bottom": "0.75in",
+        "margin-left": "0.75in",
+        "encoding": "UTF-8",
+        "no-outline": None,
+    }
+)
+
+# Files and URLs may also reference local resources
+_FILE_OPTIONS = MappingProxyType(
+    {**_STRING_OPTIONS, "enable-local-file-access": None}
+)
+
+
+def _option_args(options: Mapping[str, Any]) -> List[str]:
+    """
+    Turn a pdfkit-style options dictionary into wkhtmltopdf arguments.
+
+    Args:
+        options: Option names (without leading dashes) mapped to values,
+            or None for flags
+
+    Returns:
+        Command-line arguments
+    """
+    args = []
+    for name, value in options.items():
+        args.append(f"--{name.lstrip('-')}")
+        if value is not None:
+            args.append(str(value))
+    return args
+
+
+def _with_overrides(
+    defaults: Mapping[str, Any], options: Optional[Dict[str, Any]]
+) -> Mapping[str, Any]:
+    """
+    Merge caller options over a set of default options.
+
+    Args:
+        defaults: Default options
+        options: Options overriding the defaults (optional)
+
+    Returns:
+        The defaults themselves if there is nothing to override, otherwise
+        a new merged dictionary
+    """
+    if not options:
+        return defaults
+    return {**defaults, **options}
+
+
+def _pdf_written(path: Path) -> bool:
+    """
+    Check that wkhtmltopdf wrote a non-empty file, with a single stat.
+
+    Args:
+        path: Output PDF path
+
+    Returns:
+        True if the file exists and is not empty
+    """
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def _quote_stdin_arg(arg: str) -> str:
+    """
+    Quote an argument for a wkhtmltopdf --read-args-from-stdin line.
+
+    Args:
+        arg: Argument
+
+    Returns:
+        Double-quoted argument with backslashes and quotes escaped
+    """
+    escaped = arg.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_wkhtmltopdf() -> Optional[str]:
+    """
+    Locate wkhtmltopdf once per process.
+
+    Returns:
+        wkhtmltopdf command or executable path, or None if not found
+    """
+    if shutil.which("wkhtmltopdf"):
+        logger.info("Found wkhtmltopdf at: wkhtmltopdf")
+        return "wkhtmltopdf"
+
+    for path in _WKHTMLTOPDF_PATHS:
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            logger.info("Found wkhtmltopdf at: %s", path)
+            return path
+
+    return None
+
 
 class HTMLConverter:
     """
@@ -26,6 +147,7 @@ class HTMLConverter:
         """
         self.config = config
         self.wkhtmltopdf_path = self._find_wkhtmltopdf()
+        self._pdfkit_config = None
         logger.info("HTMLConverter initialized")
 
     def _find_wkhtmltopdf(self) -> Optional[str]:
@@ -35,35 +157,26 @@ class HTMLConverter:
         Returns:
             Path to wkhtmltopdf executable or None if not found
         """
-        possible_paths = [
-            "wkhtmltopdf",
-            "/usr/bin/wkhtmltopdf",
-            "/usr/local/bin/wkhtmltopdf",
-            "C:\\Program Files\\wkhtmltopdf\\bin\\wkhtmltopdf.exe",
-            "C:\\Program Files (x86)\\wkhtmltopdf\\bin\\wkhtmltopdf.exe",
-        ]
+        path = _discover_wkhtmltopdf()
+        if path is None:
+            logger.warning("wkhtmltopdf not found in standard locations")
+        return path
 
-        for path in possible_paths:
-            if os.path.isfile(path) or self._which(path):
-                logger.info(f"Found wkhtmltopdf at: {path}")
-                return path
-
-        logger.warning("wkhtmltopdf not found in standard locations")
-        return None
-
-    def _which(self, program: str) -> bool:
+    def _pdfkit_configuration(self):
         """
-        Check if a program exists in PATH.
-
-        Args:
-            program: Program name to check
+        Get the pdfkit configuration, building it on first use.
 
         Returns:
-            True if program exists in PATH
+            pdfkit configuration for the wkhtmltopdf found, or None to let
+            pdfkit look for it
         """
-        import shutil
+        if self._pdfkit_config is None and self.wkhtmltopdf_path:
+            import pdfkit
 
-        return shutil.which(program) is not None
+            self._pdfkit_config = pdfkit.configuration(
+                wkhtmltopdf=self.wkhtmltopdf_path
+            )
+        return self._pdfkit_config
 
     def to_pdf(
         self,
@@ -83,44 +196,28 @@ class HTMLConverter:
             Path to the created PDF file
 
         Raises:
-            RuntimeError: If wkhtmltopdf not found or conversion fails
+            OSError: If the HTML file doesn't exist or no PDF was written
+            RuntimeError: If wkhtmltopdf not found
         """
         try:
             output_path = Path(output_path)
 
-            logger.info(f"Converting HTML to PDF: {html_source}")
-            logger.info(f"Output: {output_path}")
+            logger.info("Converting HTML to PDF: %s", html_source)
+            logger.info("Output: %s", output_path)
 
             # Create output directory if it doesn't exist
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Default options
-            default_options = {
-                "page-size": "A4",
-                "margin-top": "0.75in",
-                "margin-right": "0.75in",
-                "margin-bottom": "0.75in",
-                "margin-left": "0.75in",
-                "encoding": "UTF-8",
-                "no-outline": None,
-                "enable-local-file-access": None,
-            }
-
-            # Merge with user options
-            if options:
-                default_options.update(options)
-
-            # Configuration for pdfkit
-            config = None
-            if self.wkhtmltopdf_path:
-                config = pdfkit.configuration(
-                    wkhtmltopdf=self.wkhtmltopdf_path
-                )
+            FileHandler.ensure_directory(output_path.parent)
+
+            default_options = self._file_options(options)
+
+            import pdfkit
+
+            config = self._pdfkit_configuration()
 
             # Determine if input is URL or file path
             if html_source.startswith(("http://", "https://")):
                 # URL
-                logger.info(f"Converting URL: {html_source}")
+                logger.info("Converting URL: %s", html_source)
                 pdfkit.from_url(
                     html_source,
                     str(output_path),
@@ -128,29 +225,21 @@ class HTMLConverter:
                     configuration=config,
                 )
             else:
-                # File path
-                html_path = Path(html_source)
-                if not html_path.exists():
-                    raise FileNotFoundError(
-                        f"HTML file not found: {html_path}"
-                    )
-
-                logger.info(f"Converting HTML file: {html_path}")
+                # File path; pdfkit checks that it exists and that a
+                # non-empty PDF was written
+                logger.info("Converting HTML file: %s", html_source)
                 pdfkit.from_file(
-                    str(html_path),
+                    html_source,
                     str(output_path),
                     options=default_options,
                     configuration=config,
                 )
 
-            if not output_path.exists():
-                raise RuntimeError(f"PDF was not created: {output_path}")
-
-            logger.info(f"Successfully created PDF: {output_path}")
+            logger.info("Successfully created PDF: %s", output_path)
             return str(output_path)
 
         except Exception as e:
-            logger.error(f"Failed to convert HTML to PDF: {e}")
+            logger.error("Failed to convert HTML to PDF: %s", e)
             if "No wkhtmltopdf executable found" in str(e):
                 raise RuntimeError(
                     "wkhtmltopdf not found. Please install wkhtmltopdf:\n"
@@ -160,6 +249,172 @@ class HTMLConverter:
                 )
             raise
 
+    async def to_pdf_async(
+        self,
+        html_source: str,
+        output_path: Union[str, Path],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Convert HTML to PDF without blocking the event loop.
+
+        wkhtmltopdf is awaited as an asyncio subprocess with the same
+        options as to_pdf.
+
+        Args:
+            html_source: HTML file path or URL
+            output_path: Path for output PDF file
+            options: Additional wkhtmltopdf options
+
+        Returns:
+            Path to the created PDF file
+
+        Raises:
+            FileNotFoundError: If the HTML file doesn't exist
+            RuntimeError: If wkhtmltopdf not found or conversion fails
+        """
+        try:
+            output_path = Path(output_path)
+
+            if not self.wkhtmltopdf_path:
+                raise RuntimeError("wkhtmltopdf not found")
+
+            logger.info("Converting HTML to PDF: %s", html_source)
+
+            if not html_source.startswith(("http://", "https://")):
+                if not Path(html_source).exists():
+                    raise FileNotFoundError(
+                        f"HTML file not found: {html_source}"
+                    )
+
+            FileHandler.ensure_directory(output_path.parent)
+
+            cmd = [self.wkhtmltopdf_path, "--quiet"]
+            cmd.extend(_option_args(self._file_options(options)))
+            cmd.extend([html_source, str(output_path)])
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=300  # 5 minutes timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.error("wkhtmltopdf timed out")
+                raise RuntimeError("Conversion timed out after 5 minutes")
+
+            if process.returncode != 0 or not _pdf_written(output_path):
+                stderr_text = stderr.decode(errors="replace")
+                logger.error("wkhtmltopdf failed: %s", stderr_text)
+                raise RuntimeError(f"PDF was not created: {output_path}")
+
+            logger.info("Successfully created PDF: %s", output_path)
+            return str(output_path)
+
+        except Exception as e:
+            logger.error("Failed to convert HTML to PDF: %s", e)
+            raise
+
+    def batch_to_pdf(
+        self,
+        pairs: List[Tuple[str, Union[str, Path]]],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Convert several HTML files or URLs to PDF with one wkhtmltopdf process.
+
+        wkhtmltopdf reads one conversion per line from stdin, so the
+        rendering engine is loaded once for the whole batch.
+
+        Args:
+            pairs: (HTML file path or URL, output PDF path) pairs
+            options: Additional wkhtmltopdf options applied to every page
+
+        Returns:
+            Paths to the created PDF files, in input order
+
+        Raises:
+            FileNotFoundError: If an HTML file doesn't exist
+            RuntimeError: If wkhtmltopdf not found or conversion fails
+        """
+        try:
+            if not pairs:
+                return []
+
+            if not self.wkhtmltopdf_path:
+                raise RuntimeError("wkhtmltopdf not found")
+
+            logger.info("Converting %d HTML sources to PDF", len(pairs))
+
+            lines = []
+            output_paths = []
+            for html_source, output_path in pairs:
+                output_path = Path(output_path)
+                if not html_source.startswith(("http://", "https://")):
+                    if not Path(html_source).exists():
+                        raise FileNotFoundError(
+                            f"HTML file not found: {html_source}"
+                        )
+
+                FileHandler.ensure_directory(output_path.parent)
+                lines.append(
+                    " ".join(
+                        _quote_stdin_arg(arg)
+                        for arg in (html_source, str(output_path))
+                    )
+                )
+                output_paths.append(output_path)
+
+            cmd = [self.wkhtmltopdf_path, "--quiet"]
+            cmd.extend(_option_args(self._file_options(options)))
+            cmd.append("--read-args-from-stdin")
+
+            result = subprocess.run(
+                cmd,
+                input="\n".join(lines) + "\n",
+                capture_output=True,
+                text=True,
+                timeout=300 * len(pairs),  # 5 minutes per page
+            )
+
+            missing = [
+                str(path) for path in output_paths if not _pdf_written(path)
+            ]
+            if result.returncode != 0 or missing:
+                logger.error("wkhtmltopdf batch failed: %s", result.stderr)
+                raise RuntimeError(
+                    f"PDF was not created: {', '.join(missing) or result.stderr}"
+                )
+
+            logger.info("Successfully created %d PDFs", len(output_paths))
+            return [str(path) for path in output_paths]
+
+        except subprocess.TimeoutExpired:
+            logger.error("wkhtmltopdf batch timed out")
+            raise RuntimeError("Batch conversion timed out")
+        except Exception as e:
+            logger.error("Failed to convert HTML batch to PDF: %s", e)
+            raise
+
+    def _file_options(
+        self, options: Optional[Dict[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        """
+        Build the wkhtmltopdf options used for files and URLs.
+
+        Args:
+            options: Additional options overriding the defaults
+
+        Returns:
+            Merged options mapping
+        """
+        return _with_overrides(_FILE_OPTIONS, options)
+
     def from_string(
         self,
         html_string: str,
@@ -181,34 +436,19 @@ class HTMLConverter:
             output_path = Path(output_path)
 
             logger.info("Converting HTML string to PDF")
-            logger.info(f"Output: {output_path}")
+            logger.info("Output: %s", output_path)
 
             # Create output directory if it doesn't exist
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Default options
-            default_options = {
-                "page-size": "A4",
-                "margin-top": "0.75in",
-                "margin-right": "0.75in",
-                "margin-bottom": "0.75in",
-                "margin-left": "0.75in",
-                "encoding": "UTF-8",
-                "no-outline": None,
-            }
-
-            # Merge with user options
-            if options:
-                default_options.update(options)
-
-            # Configuration for pdfkit
-            config = None
-            if self.wkhtmltopdf_path:
-                config = pdfkit.configuration(
-                    wkhtmltopdf=self.wkhtmltopdf_path
-                )
+            FileHandler.ensure_directory(output_path.parent)
+
+            default_options = _with_overrides(_STRING_OPTIONS, options)
+
+            import pdfkit
 
-            # Convert HTML string to PDF
+            config = self._pdfkit_configuration()
+
+            # Convert HTML string to PDF; pdfkit checks that a non-empty PDF
+            # was written
             pdfkit.from_string(
                 html_string,
                 str(output_path),
@@ -216,12 +456,9 @@ class HTMLConverter:
                 configuration=config,
             )
 
-            if not output_path.exists():
-                raise RuntimeError(f"PDF was not created: {output_path}")
-
-            logger.info(f"Successfully created PDF: {output_path}")
+            logger.info("Successfully created PDF: %s", output_path)
             return str(output_path)
 
         except Exception as e:
-            logger.error(f"Failed to convert HTML string to PDF: {e}")
+            logger.error("Failed to convert HTML string to PDF: %s", e)
             raise
@@ -2,18 +2,427 @@
 PDF conversion utilities for converting PDFs to images.
 """
 
+import asyncio
+import functools
 import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Union
-
-from pdf2image import convert_from_path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
+# pdf2image, pypdfium2, simplejpeg and PIL are imported where they are used,
+# so importing the package does not pay for loading them
 logger = logging.getLogger(__name__)
 
+DEFAULT_JPEG_QUALITY = 95
+
+# Formats pdftoppm writes itself, so pages never pass through PIL
+_POPPLER_FORMATS = ("jpeg", "png")
+# Every format pages can be saved in; the rest are encoded by PIL
+_IMAGE_FORMATS = frozenset(_POPPLER_FORMATS + ("tiff", "webp", "bmp"))
+
+# A linearized PDF starts with a parameter dictionary giving the file length
+# (/L) and page count (/N) within its first 1024 bytes
+_LINEARIZATION_HEAD_SIZE = 1024
+_LINEARIZATION_DICT = re.compile(rb"<<\s*/Linearized\s+[\d.]+(.*?)>>", re.S)
+_LINEARIZATION_PARAM = re.compile(rb"/([LN])\s+(\d+)")
+
+# Pages rendered per pdftoppm run when they have to be re-encoded by PIL
+_REENCODE_BATCH_PAGES = 10
+
+# Fewest pages worth a chunk of their own: starting a worker process or a
+# pdftoppm run costs about as much as rendering a handful of pages
+_MIN_CHUNK_PAGES = 8
+
+# PDFium is not thread-safe: every in-process call into it, from any
+# thread, holds this lock
+_pdfium_lock = threading.Lock()
+
+# Memory for encoded pages kept to skip re-rendering them; a single page may
+# take at most an eighth of it
+_PAGE_CACHE_BYTES = 64 << 20
+
+
+def _page_filename(format: str, final_page: int) -> str:
+    """
+    Build the file name template for rendered pages.
+
+    Page numbers are zero-padded to the width of the final page number, and
+    to at least three digits, so the names sort in page order.
+
+    Args:
+        format: Lowercase output format
+        final_page: Last page number of the whole conversion
+
+    Returns:
+        Template to call ``.format(page_num)`` on
+    """
+    width = max(3, len(str(final_page)))
+    return f"page_{{:0{width}d}}.{format}"
+
+
+def _split_page_range(first: int, last: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split an inclusive page range into contiguous, near-equal chunks.
+
+    Args:
+        first: First page (1-indexed)
+        last: Last page (1-indexed)
+        parts: Maximum number of chunks
+
+    Returns:
+        (first, last) page pairs in order
+    """
+    count = last - first + 1
+    parts = max(1, min(parts, count))
+    return [
+        (first + i * count // parts, first + (i + 1) * count // parts - 1)
+        for i in range(parts)
+    ]
+
+
+def _linearized_page_count(pdf_path: Path) -> Optional[int]:
+    """
+    Read the page count from a linearized ("Fast Web View") PDF's header.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Page count, or None if the file is not linearized, has been updated
+        since (its length no longer matches /L) or cannot be read
+    """
+    try:
+        with open(pdf_path, "rb") as f:
+            head = f.read(_LINEARIZATION_HEAD_SIZE)
+            size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return None
+
+    match = _LINEARIZATION_DICT.search(head)
+    if match is None:
+        return None
+    params = dict(_LINEARIZATION_PARAM.findall(match.group(1)))
+    if b"N" not in params or int(params.get(b"L", -1)) != size:
+        return None
+    return int(params[b"N"])
+
+
+def _count_pages(pdf_path: Path, use_pdfium: bool) -> int:
+    """
+    Count a PDF's pages without rendering it.
+
+    Args:
+        pdf_path: Path to the PDF file
+        use_pdfium: Count with pypdfium2 instead of poppler's pdfinfo
+
+    Returns:
+        Number of pages
+
+    Raises:
+        Exception: If neither the backend nor PyPDF2 can read the PDF
+    """
+    page_count = _linearized_page_count(pdf_path)
+    if page_count is not None:
+        return page_count
+
+    try:
+        if use_pdfium:
+            return _pdfium_page_count(pdf_path)
+
+        from pdf2image import pdfinfo_from_path
+
+        return pdfinfo_from_path(str(pdf_path))["Pages"]
+
+    except Exception as e:
+        logger.error("Failed to get page count: %s", e)
+        # Fallback: parse the PDF in Python
+        try:
+            from PyPDF2 import PdfReader
+
+            return len(PdfReader(str(pdf_path)).pages)
+        except Exception as e2:
+            logger.error("Fallback method also failed: %s", e2)
+            raise e
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_page_count(path: str, mtime_ns: int, size: int, use_pdfium: bool) -> int:
+    """
+    Count a PDF's pages once per version of the file.
+
+    Args:
+        path: Absolute path to the PDF file
+        mtime_ns: Modification time, so a rewritten file misses the cache
+        size: File size, for the same reason
+        use_pdfium: Count with pypdfium2 instead of poppler's pdfinfo
+
+    Returns:
+        Number of pages
+    """
+    return _count_pages(Path(path), use_pdfium)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pdfium() -> Any:
+    """
+    Import pypdfium2 once per process if it is installed.
+
+    Returns:
+        The pypdfium2 module, or None if it is not installed
+    """
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    return pypdfium2
+
+
+@functools.lru_cache(maxsize=None)
+def _load_simplejpeg() -> Any:
+    """
+    Import simplejpeg once per process if it is installed.
+
+    Returns:
+        The simplejpeg module, or None if it is not installed
+    """
+    try:
+        import simplejpeg
+    except ImportError:
+        return None
+    return simplejpeg
+
+
+def _encode_jpeg(simplejpeg: Any, bitmap: Any, quality: int) -> bytes:
+    """
+    Encode a rendered PDFium bitmap as baseline JPEG with simplejpeg.
+
+    The pixels are handed over as they are (RGB, or single-channel when
+    rendered in grayscale) without converting them to a PIL image first.
+
+    Args:
+        simplejpeg: The simplejpeg module
+        bitmap: pypdfium2 PdfBitmap
+        quality: JPEG quality
+
+    Returns:
+        JPEG data
+    """
+    pixels = bitmap.to_numpy()
+    if bitmap.mode == "L":
+        colorspace, subsampling = "GRAY", "Gray"
+    else:
+        # Chroma subsampling as Pillow applies it by default
+        colorspace, subsampling = bitmap.mode, "420"
+    return simplejpeg.encode_jpeg(
+        # Grayscale bitmaps come as 2D arrays; the encoder wants a channel axis
+        pixels.reshape(*pixels.shape[:2], -1),
+        quality=quality,
+        colorspace=colorspace,
+        colorsubsampling=subsampling,
+    )
+
+
+def _pdfium_page_count(pdf_path: Path) -> int:
+    """
+    Count a PDF's pages with PDFium without rendering anything.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Number of pages
+    """
+    with _pdfium_lock:
+        pdf = _load_pdfium().PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+
+def _render_with_pdfium(
+    pdf_path: Path,
+    output_dir: Path,
+    format: str,
+    dpi: int,
+    first_page: Optional[int],
+    last_page: Optional[int],
+    final_page: Optional[int],
+    grayscale: bool,
+    save_options: Dict[str, Any],
+) -> List[str]:
+    """
+    Render a contiguous page range in-process with PDFium and save each page.
+
+    Baseline JPEG pages are encoded with simplejpeg (libjpeg-turbo) when it
+    is installed, which is considerably faster than PIL's encoder. It cannot
+    write optimized or progressive JPEGs, so those are left to PIL.
+
+    PDFium calls hold _pdfium_lock, so concurrent conversions in other
+    threads are safe; pages are encoded with the lock released.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Directory to save image files
+        format: Lowercase output format
+        dpi: Resolution in DPI
+        first_page: First page to convert (1-indexed, optional)
+        last_page: Last page to convert (1-indexed, optional)
+        final_page: Last page of the whole conversion, which sets the
+            zero-padding of the file names (defaults to the last page)
+        grayscale: Whether to render single-channel pages
+        save_options: Keyword arguments for PIL's Image.save
+
+    Returns:
+        List of created image file paths, in page order
+    """
+    output_files = []
+    simplejpeg = None
+    if format == "jpeg" and not (
+        save_options["optimize"] or save_options["progressive"]
+    ):
+        simplejpeg = _load_simplejpeg()
+
+    with _pdfium_lock:
+        pdf = _load_pdfium().PdfDocument(str(pdf_path))
+        page_count = len(pdf)
+    try:
+        first_page = first_page or 1
+        last_page = last_page or page_count
+        filename = _page_filename(format, final_page or last_page)
+        # PDF user space is 72 units per inch
+        scale = dpi / 72
+        pil_format = format.upper()
+
+        for page_num in range(first_page, last_page + 1):
+            with _pdfium_lock:
+                page = pdf[page_num - 1]
+                try:
+                    # RGB byte order lets PIL and simplejpeg take the packed
+                    # three-byte pixels without swapping channels
+                    bitmap = page.render(
+                        scale=scale, grayscale=grayscale, rev_byteorder=True
+                    )
+                finally:
+                    page.close()
+
+            output_path = output_dir / filename.format(page_num)
+            try:
+                # Only reads the bitmap's memory, so PDFium is free meanwhile
+                if simplejpeg is not None:
+                    output_path.write_bytes(
+                        _encode_jpeg(simplejpeg, bitmap, save_options["quality"])
+                    )
+                else:
+                    bitmap.to_pil().save(output_path, pil_format, **save_options)
+            finally:
+                with _pdfium_lock:
+                    bitmap.close()
+            output_files.append(str(output_path))
+            logger.info("Saved: %s", output_path)
+    finally:
+        with _pdfium_lock:
+            pdf.close()
+
+    return output_files
+
+
+def _worker_context() -> Any:
+    """
+    Get the multiprocessing context for PDFium worker processes.
+
+    Returns:
+        The forkserver context where available, otherwise spawn
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class _PageCache:
+    """
+    Encoded page images kept in memory within a total size budget, dropping
+    the least recently used first.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Total size of the pages kept
+        """
+        self.max_bytes = max_bytes
+        self._pages: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether a page is cached without marking it as used."""
+        with self._lock:
+            return key in self._pages
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Look up a page.
+
+        Args:
+            key: Page key
+
+        Returns:
+            Encoded page, or None if it is not cached
+        """
+        with self._lock:
+            data = self._pages.get(key)
+            if data is not None:
+                self._pages.move_to_end(key)
+            return data
+
+    def add_file(self, key: Hashable, path: Union[str, Path]) -> None:
+        """
+        Cache a page from its image file, unless the file is too large.
+
+        Args:
+            key: Page key
+            path: Encoded page image
+        """
+        if os.path.getsize(path) > self.max_bytes // 8:
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+
+        with self._lock:
+            old = self._pages.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._pages[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._pages.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """
+        Drop every cached page.
+        """
+        with self._lock:
+            self._pages.clear()
+            self._size = 0
+
+
+_page_cache = _PageCache(_PAGE_CACHE_BYTES)
+
 
 class PDFConverter:
     """
-    Handles PDF to image conversions using pdf2image library.
+    Handles PDF to image conversions, rendering in-process with pypdfium2
+    when it is installed and with poppler (via pdf2image) otherwise.
     """
 
     def __init__(self, config=None):
@@ -24,6 +433,10 @@ class PDFConverter:
             config: Configuration object (optional)
         """
         self.config = config
+        # Default number of chunks per conversion; None follows the config.
+        # Batch worker processes set it to 1, since the pool already keeps
+        # every CPU busy with one file each.
+        self.thread_count: Optional[int] = None
         logger.info("PDFConverter initialized")
 
     def to_images(
@@ -34,70 +447,653 @@ class PDFConverter:
         dpi: int = 200,
         first_page: int = None,
         last_page: int = None,
+        thread_count: Optional[int] = None,
     ) -> List[str]:
         """
         Convert PDF pages to image files.
 
+        Longer page ranges are split into contiguous chunks that are
+        rendered and saved concurrently. pypdfium2 renders without poppler
+        subprocesses or scratch files, one worker process (with its own
+        document) per chunk since PDFium is not thread-safe; with poppler
+        each chunk is one pdftoppm process.
+
+        It is safe to call from several threads at once: in-process PDFium
+        calls are serialized, and PDFium workers are started through
+        forkserver (or spawn) rather than forked, so scripts starting
+        parallel conversions need the usual ``if __name__ == "__main__":``
+        guard.
+
+        Pages are saved as page_001.<format> and so on, with as many digits
+        as the last page number needs.
+
+        With output.page_cache enabled, encoded pages are also kept in a
+        small in-process cache, keyed by the file's path, modification time
+        and size, the page and every rendering setting. When all requested
+        pages are cached they are written out again without rendering
+        anything. Filling it reads every page back from disk, so it is off
+        by default and only worth it when the same pages are requested
+        repeatedly.
+
         Args:
             pdf_path: Path to the PDF file
             output_dir: Directory to save image files
-            format: Output format ('jpeg', 'png')
+            format: Output format ('jpeg', 'png', 'tiff', 'webp' or 'bmp')
             dpi: Resolution in DPI
             first_page: First page to convert (1-indexed, optional)
             last_page: Last page to convert (1-indexed, optional)
+            thread_count: Number of chunks to render in parallel (defaults to
+                the converter's thread_count, then conversion.max_workers,
+                or the CPU count without a config; every chunk has at least
+                8 pages, so short ranges render in-process in one piece)
 
         Returns:
             List of created image file paths
 
         Raises:
+            ValueError: If the format is not supported
             Exception: If conversion fails
         """
         try:
+            # Reject bad formats before any rendering starts
+            if format.lower() not in _IMAGE_FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+
             pdf_path = Path(pdf_path)
             output_dir = Path(output_dir)
 
-            logger.info(f"Converting PDF to images: {pdf_path}")
-            logger.info(f"Output directory: {output_dir}")
-            logger.info(f"Format: {format}, DPI: {dpi}")
+            logger.info("Converting PDF to images: %s", pdf_path)
+            logger.info("Output directory: %s", output_dir)
+            logger.info("Format: %s, DPI: %s", format, dpi)
 
-            # Convert PDF to images
-            images = convert_from_path(
-                pdf_path, dpi=dpi, first_page=first_page, last_page=last_page
-            )
+            cache_key = None
+            if self._output_option("page_cache", False):
+                cache_key = self._page_cache_key(pdf_path, format.lower(), dpi)
+            first = first_page or 1
+            # Only count the pages once the first one is known to be cached
+            if cache_key is not None and cache_key + (first,) in _page_cache:
+                last = last_page or self.get_page_count(pdf_path)
+                output_files = self._write_cached_pages(
+                    cache_key, output_dir, format.lower(), first, last
+                )
+                if output_files is not None:
+                    logger.info(
+                        "Wrote %d cached pages as %s", len(output_files), format
+                    )
+                    return output_files
 
-            output_files = []
+            if thread_count is None:
+                thread_count = self._default_thread_count()
 
-            # Save each page as an image
-            for i, image in enumerate(images):
-                page_num = (first_page or 1) + i
-                filename = f"page_{page_num:03d}.{format.lower()}"
-                output_path = output_dir / filename
+            if self._use_pdfium():
+                output_files = self._render_pdfium_chunks(
+                    pdf_path,
+                    output_dir,
+                    format.lower(),
+                    dpi,
+                    first_page,
+                    last_page,
+                    thread_count,
+                )
+            else:
+                output_files = self._render_chunks(
+                    pdf_path,
+                    output_dir,
+                    format,
+                    dpi,
+                    first_page,
+                    last_page,
+                    thread_count,
+                )
 
-                # Save with appropriate format and quality
-                if format.lower() == "jpeg":
-                    image.save(output_path, "JPEG", quality=95, optimize=True)
-                elif format.lower() == "png":
-                    image.save(output_path, "PNG", optimize=True)
-                else:
-                    image.save(output_path, format.upper())
-
-                output_files.append(str(output_path))
-                logger.info(f"Saved: {output_path}")
+            if cache_key is not None:
+                for page_num, path in enumerate(output_files, start=first):
+                    _page_cache.add_file(cache_key + (page_num,), path)
 
             logger.info(
-                f"Successfully converted {
-                    len(images)} pages to {format}"
+                "Successfully converted %d pages to %s", len(output_files), format
             )
             return output_files
 
         except Exception as e:
-            logger.error(f"Failed to convert PDF to images: {e}")
+            logger.error("Failed to convert PDF to images: %s", e)
             raise
 
+    async def to_images_async(
+        self,
+        pdf_path: Union[str, Path],
+        output_dir: Union[str, Path],
+        format: str = "jpeg",
+        dpi: int = 200,
+        first_page: int = None,
+        last_page: int = None,
+        thread_count: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Convert PDF pages to image files without blocking the event loop.
+
+        Runs to_images in the loop's default executor; see to_images for the
+        arguments.
+
+        Returns:
+            List of created image file paths
+
+        Raises:
+            Exception: If conversion fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.to_images,
+                pdf_path,
+                output_dir,
+                format=format,
+                dpi=dpi,
+                first_page=first_page,
+                last_page=last_page,
+                thread_count=thread_count,
+            ),
+        )
+
+    async def gather_to_images(
+        self,
+        pdf_paths: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        format: str = "jpeg",
+        dpi: int = 200,
+        concurrency: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Convert several PDFs to images concurrently.
+
+        Each PDF's pages are saved in ``output_dir/<stem>``, so the inputs'
+        stems must be distinct (ignoring case, for case-insensitive
+        filesystems). Conversions
+        run in the loop's default executor, at most ``concurrency`` at a
+        time: every one still splits its pages into parallel chunks, so
+        the limit keeps memory and processes in check.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+            output_dir: Directory for the per-PDF image directories
+            format: Output format ('jpeg', 'png', 'tiff', 'webp' or 'bmp')
+            dpi: Resolution in DPI
+            concurrency: Maximum PDFs converted at once (defaults to half the
+                CPU count, at least one)
+
+        Returns:
+            Lists of created image file paths, in input order
+
+        Raises:
+            ValueError: If two inputs share a stem and would overwrite each
+                other's pages
+            Exception: If a conversion fails
+        """
+        output_dir = Path(output_dir)
+        pdf_paths = [Path(path) for path in pdf_paths]
+
+        seen: Dict[str, Path] = {}
+        for pdf_path in pdf_paths:
+            other = seen.setdefault(pdf_path.stem.casefold(), pdf_path)
+            if other is not pdf_path:
+                raise ValueError(
+                    f"{other} and {pdf_path} would both be saved in "
+                    f"{output_dir / pdf_path.stem}"
+                )
+
+        if concurrency is None:
+            concurrency = max(1, (os.cpu_count() or 1) // 2)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def convert(pdf_path: Path) -> List[str]:
+            pdf_dir = output_dir / pdf_path.stem
+            pdf_dir.mkdir(parents=True, exist_ok=True)
+            async with semaphore:
+                return await self.to_images_async(
+                    pdf_path, pdf_dir, format=format, dpi=dpi
+                )
+
+        return list(await asyncio.gather(*(convert(path) for path in pdf_paths)))
+
+    def _page_cache_key(
+        self, pdf_path: Path, format: str, dpi: int
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """
+        Build the part of the page cache key shared by a PDF's pages.
+
+        Args:
+            pdf_path: Path to the PDF file
+            format: Lowercase output format
+            dpi: Resolution in DPI
+
+        Returns:
+            Key to extend with the page number, or None if the file cannot
+            be stat'ed (the renderers then report why)
+        """
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            return None
+        return (
+            os.path.abspath(pdf_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self._use_pdfium(),
+            format,
+            dpi,
+            bool(self._output_option("grayscale", False)),
+            tuple(sorted(self._save_options(format).items())),
+        )
+
+    @staticmethod
+    def _write_cached_pages(
+        cache_key: Tuple[Hashable, ...],
+        output_dir: Path,
+        format: str,
+        first_page: int,
+        last_page: int,
+    ) -> Optional[List[str]]:
+        """
+        Write a page range from the page cache if every page is in it.
+
+        Args:
+            cache_key: Key from _page_cache_key
+            output_dir: Directory to save image files
+            format: Lowercase output format
+            first_page: First page to write (1-indexed)
+            last_page: Last page to write (1-indexed)
+
+        Returns:
+            List of created image file paths, in page order, or None if any
+            page has to be rendered
+        """
+        pages = []
+        for page_num in range(first_page, last_page + 1):
+            data = _page_cache.get(cache_key + (page_num,))
+            if data is None:
+                return None
+            pages.append(data)
+
+        output_files = []
+        filename = _page_filename(format, last_page)
+        for page_num, data in enumerate(pages, start=first_page):
+            output_path = output_dir / filename.format(page_num)
+            output_path.write_bytes(data)
+            output_files.append(str(output_path))
+            logger.info("Saved: %s", output_path)
+        return output_files
+
+    def _use_pdfium(self) -> bool:
+        """
+        Decide whether pages are rendered with pypdfium2 or poppler.
+
+        output.renderer selects 'pdfium' or 'poppler'; the default, 'auto',
+        uses pypdfium2 whenever it is installed.
+
+        Returns:
+            True to render with pypdfium2
+
+        Raises:
+            RuntimeError: If 'pdfium' is configured but not installed
+        """
+        renderer = self._output_option("renderer", "auto")
+        if renderer == "poppler":
+            return False
+        available = _load_pdfium() is not None
+        if renderer == "pdfium" and not available:
+            raise RuntimeError(
+                "output.renderer is 'pdfium' but pypdfium2 is not installed"
+            )
+        return available
+
+    @staticmethod
+    def _plan_chunks(
+        first_page: Optional[int],
+        last_page: Optional[int],
+        thread_count: int,
+        count_pages: Callable[[], int],
+    ) -> List[Tuple[int, int]]:
+        """
+        Split a page range into chunks to render in parallel.
+
+        Args:
+            first_page: First page to convert (1-indexed, optional)
+            last_page: Last page to convert (1-indexed, optional)
+            thread_count: Maximum number of chunks
+            count_pages: Returns the page count; only called for an
+                open-ended range
+
+        Returns:
+            (first, last) page pairs in order, each of at least
+            _MIN_CHUNK_PAGES pages; empty when the range should be rendered
+            in one piece
+        """
+        # A range too short to split never needs the page count
+        if thread_count <= 1 or (
+            first_page is not None
+            and last_page is not None
+            and last_page - first_page + 1 < 2 * _MIN_CHUNK_PAGES
+        ):
+            return []
+        start = first_page or 1
+        end = last_page or count_pages()
+        parts = min(thread_count, (end - start + 1) // _MIN_CHUNK_PAGES)
+        if parts <= 1:
+            return []
+        return _split_page_range(start, end, parts)
+
+    def _render_pdfium_chunks(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        format: str,
+        dpi: int,
+        first_page: Optional[int],
+        last_page: Optional[int],
+        thread_count: int,
+    ) -> List[str]:
+        """
+        Render a page range with PDFium, one worker process per contiguous
+        chunk.
+
+        Args:
+            pdf_path: Path to the PDF file
+            output_dir: Directory to save image files
+            format: Lowercase output format
+            dpi: Resolution in DPI
+            first_page: First page to convert (1-indexed, optional)
+            last_page: Last page to convert (1-indexed, optional)
+            thread_count: Maximum number of chunks rendered in parallel
+
+        Returns:
+            List of created image file paths, in page order
+        """
+        render_options = (
+            self._output_option("grayscale", False),
+            self._save_options(format),
+        )
+        chunks = self._plan_chunks(
+            first_page, last_page, thread_count, lambda: self.get_page_count(pdf_path)
+        )
+
+        if len(chunks) <= 1:
+            return _render_with_pdfium(
+                pdf_path,
+                output_dir,
+                format,
+                dpi,
+                first_page,
+                last_page,
+                last_page,
+                *render_options,
+            )
+
+        # Every chunk pads its file names to the same width
+        final_page = chunks[-1][1]
+        # PDFium keeps global state and is not thread-safe, so each chunk
+        # opens the document in its own process. Other threads may be
+        # inside PDFium or holding import locks, so the workers are not
+        # forked from this process but started from a clean one.
+        with ProcessPoolExecutor(
+            max_workers=len(chunks), mp_context=_worker_context()
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _render_with_pdfium,
+                    pdf_path,
+                    output_dir,
+                    format,
+                    dpi,
+                    chunk_first,
+                    chunk_last,
+                    final_page,
+                    *render_options,
+                )
+                for chunk_first, chunk_last in chunks
+            ]
+            # Chunks are in page order, so concatenating keeps it
+            return [path for future in futures for path in future.result()]
+
+    def _render_chunks(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        format: str,
+        dpi: int,
+        first_page: Optional[int],
+        last_page: Optional[int],
+        thread_count: int,
+    ) -> List[str]:
+        """
+        Render a page range with poppler, one process per contiguous chunk.
+
+        Args:
+            pdf_path: Path to the PDF file
+            output_dir: Directory to save image files
+            format: Output format ('jpeg', 'png')
+            dpi: Resolution in DPI
+            first_page: First page to convert (1-indexed, optional)
+            last_page: Last page to convert (1-indexed, optional)
+            thread_count: Maximum number of chunks rendered in parallel
+
+        Returns:
+            List of created image file paths, in page order
+        """
+        chunks = self._plan_chunks(
+            first_page,
+            last_page,
+            thread_count,
+            lambda: self.get_page_count(pdf_path),
+        )
+
+        if len(chunks) <= 1:
+            return self._render_pages(
+                pdf_path, output_dir, format, dpi, first_page, last_page, last_page
+            )
+
+        # Every chunk pads its file names to the same width
+        final_page = chunks[-1][1]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(
+                    self._render_pages,
+                    pdf_path,
+                    output_dir,
+                    format,
+                    dpi,
+                    chunk_first,
+                    chunk_last,
+                    final_page,
+                )
+                for chunk_first, chunk_last in chunks
+            ]
+            # Chunks are in page order, so concatenating keeps it
+            return [path for future in futures for path in future.result()]
+
+    def _default_thread_count(self) -> int:
+        """
+        Get the number of page chunks to render in parallel by default.
+
+        Returns:
+            The converter's thread_count if set, else the configured worker
+            count, or the CPU count without a config
+        """
+        if self.thread_count is not None:
+            return self.thread_count
+        cpu_count = os.cpu_count() or 1
+        if self.config is None:
+            return cpu_count
+        return self.config.get("conversion.max_workers", cpu_count)
+
+    def _render_pages(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        format: str,
+        dpi: int,
+        first_page: Optional[int],
+        last_page: Optional[int],
+        final_page: Optional[int],
+    ) -> List[str]:
+        """
+        Render a contiguous page range and save each page as an image.
+
+        Args:
+            pdf_path: Path to the PDF file
+            output_dir: Directory to save image files
+            format: Output format ('jpeg', 'png')
+            dpi: Resolution in DPI
+            first_page: First page to convert (1-indexed, optional)
+            last_page: Last page to convert (1-indexed, optional)
+            final_page: Last page of the whole conversion, which sets the
+                zero-padding of the file names (defaults to the last page)
+
+        Returns:
+            List of created image file paths, in page order
+        """
+        output_files = []
+        format = format.lower()
+
+        # JPEG and PNG pages are encoded by pdftoppm itself and only need
+        # renaming; other formats are re-encoded from poppler's PPM output
+        native = format in _POPPLER_FORMATS
+        encode_options = self._encode_options(format)
+
+        # Poppler writes the rendered pages to disk instead of handing back
+        # a list of decoded images. The scratch directory sits in output_dir
+        # to stay on the same filesystem (and off a RAM-backed /tmp).
+        with tempfile.TemporaryDirectory(
+            prefix=".render_", dir=output_dir
+        ) as render_dir:
+            from pdf2image import convert_from_path, pdfinfo_from_path
+            from PIL import Image
+
+            pil_format = format.upper()
+            if native:
+                batches = [(first_page, last_page)]
+            else:
+                # Uncompressed PPM pages run to tens of MB each, so only a
+                # bounded batch of them waits in the scratch directory
+                start = first_page or 1
+                end = last_page or pdfinfo_from_path(str(pdf_path))["Pages"]
+                final_page = final_page or end
+                batches = [
+                    (batch_first, min(batch_first + _REENCODE_BATCH_PAGES - 1, end))
+                    for batch_first in range(start, end + 1, _REENCODE_BATCH_PAGES)
+                ]
+
+            for batch_first, batch_last in batches:
+                page_files = convert_from_path(
+                    pdf_path,
+                    dpi=dpi,
+                    first_page=batch_first,
+                    last_page=batch_last,
+                    output_folder=render_dir,
+                    paths_only=True,
+                    **encode_options,
+                )
+
+                start = batch_first or 1
+                # An open-ended native range ends wherever poppler stopped
+                filename = _page_filename(
+                    format, final_page or start + len(page_files) - 1
+                )
+
+                for page_num, page_file in enumerate(page_files, start=start):
+                    output_path = output_dir / filename.format(page_num)
+
+                    if native:
+                        os.replace(page_file, output_path)
+                    else:
+                        with Image.open(page_file) as image:
+                            image.save(output_path, pil_format)
+                        # Free the scratch space as soon as the page is encoded
+                        os.remove(page_file)
+
+                    output_files.append(str(output_path))
+                    logger.info("Saved: %s", output_path)
+
+        return output_files
+
+    def _output_option(self, key: str, default: Any) -> Any:
+        """
+        Get an ``output.*`` setting, or its default without a config.
+
+        Args:
+            key: Setting name within the output section
+            default: Value used when unset
+
+        Returns:
+            Configured or default value
+        """
+        if self.config is None:
+            return default
+        return self.config.get(f"output.{key}", default)
+
+    def _encode_options(self, format: str) -> Dict[str, Any]:
+        """
+        Build the convert_from_path options controlling how pages are
+        encoded.
+
+        JPEG defaults to optimized Huffman tables and progressive scans:
+        both are lossless and together make pages around 20% smaller, for
+        extra encode passes that output.jpeg_optimize and
+        output.jpeg_progressive can turn off. With output.grayscale,
+        poppler renders single-channel pages, a third of the data of RGB.
+
+        Args:
+            format: Lowercase output format
+
+        Returns:
+            Keyword arguments for convert_from_path
+        """
+        options: Dict[str, Any] = {}
+        if format in _POPPLER_FORMATS:
+            options["fmt"] = format
+        if format == "jpeg":
+            quality = self._output_option("image_quality", DEFAULT_JPEG_QUALITY)
+            optimize = self._output_option("jpeg_optimize", True)
+            progressive = self._output_option("jpeg_progressive", True)
+            options["jpegopt"] = {
+                "quality": quality,
+                "optimize": "y" if optimize else "n",
+                "progressive": "y" if progressive else "n",
+            }
+        if self._output_option("grayscale", False):
+            options["grayscale"] = True
+        return options
+
+    def _save_options(self, format: str) -> Dict[str, Any]:
+        """
+        Build the PIL Image.save options for pages rendered in-process,
+        mirroring the poppler encoder settings of _encode_options.
+
+        Args:
+            format: Lowercase output format
+
+        Returns:
+            Keyword arguments for Image.save
+        """
+        if format != "jpeg":
+            return {}
+        return {
+            "quality": self._output_option("image_quality", DEFAULT_JPEG_QUALITY),
+            "optimize": bool(self._output_option("jpeg_optimize", True)),
+            "progressive": bool(self._output_option("jpeg_progressive", True)),
+        }
+
     def get_page_count(self, pdf_path: Union[str, Path]) -> int:
         """
         Get the number of pages in a PDF file.
 
+        Linearized PDFs state the count in their first kilobyte, which is
+        all that is read for them. Otherwise pypdfium2 (in-process) or
+        poppler's pdfinfo read the count from the document catalog without
+        rendering anything; PyPDF2 is used when they fail. Counts are
+        cached per process until the file's modification time or size
+        changes.
+
         Args:
             pdf_path: Path to the PDF file
 
@@ -107,25 +1103,21 @@ class PDFConverter:
         Raises:
             Exception: If unable to read PDF
         """
-        try:
-            from PyPDF2 import PdfReader
-
-            pdf_path = Path(pdf_path)
-            reader = PdfReader(str(pdf_path))
-            page_count = len(reader.pages)
+        pdf_path = Path(pdf_path)
+        use_pdfium = self._use_pdfium()
 
-            logger.info(f"PDF {pdf_path.name} has {page_count} pages")
-            return page_count
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            # Let the backends report what is wrong with the file
+            page_count = _count_pages(pdf_path, use_pdfium)
+        else:
+            page_count = _cached_page_count(
+                os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size, use_pdfium
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to get page count: {e}")
-            # Fallback: try with pdf2image
-            try:
-                images = convert_from_path(pdf_path, dpi=50)  # Low DPI for speed
-                return len(images)
-            except Exception as e2:
-                logger.error(f"Fallback method also failed: {e2}")
-                raise e
+        logger.info("PDF %s has %d pages", pdf_path.name, page_count)
+        return page_count
 
     def extract_page_range(
         self,
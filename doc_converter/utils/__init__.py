@@ -2,10 +2,12 @@
 Utility modules.
 """
 
+from .cache import ConversionCache
 from .config import Config
 from .file_handler import FileHandler
 
 __all__ = [
     "FileHandler",
     "Config",
+    "ConversionCache",
 ]
@@ -0,0 +1,283 @@
+"""
+Persistent cache of completed conversions.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Files up to this size are hashed in full; larger ones are fingerprinted
+# from their size, mtime and the first/last chunk of content
+_FULL_HASH_LIMIT = 16 * 1024 * 1024
+_EDGE_CHUNK_SIZE = 64 * 1024
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def default_cache_path() -> Path:
+    """
+    Get the default location of the conversion cache index.
+
+    Returns:
+        Path under $XDG_CACHE_HOME (or ~/.cache) for the SQLite index
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "doc_converter" / "index.sqlite"
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize values json does not handle for a cache key.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        A plain dict for mappings (such as read-only config sections), so
+        their items are keyed like any other parameter; str(value) otherwise
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _place(source: Union[str, Path], destination: Union[str, Path]) -> None:
+    """
+    Atomically make ``destination`` a hard link to (or copy of) ``source``.
+
+    Args:
+        source: Existing file
+        destination: Path to create or replace
+
+    Raises:
+        OSError: If the file cannot be linked or copied
+    """
+    staging = f"{destination}.{os.getpid()}.tmp"
+    try:
+        os.link(source, staging)
+    except OSError:
+        # Different filesystem, or links unsupported; copy2 keeps the mtime
+        # the index compares against
+        shutil.copy2(source, staging)
+    os.replace(staging, destination)
+
+
+class ConversionCache:
+    """
+    SQLite-backed index mapping input content and conversion parameters to
+    the outputs they produced.
+
+    Outputs are also kept in a store next to the index (hard-linked when
+    possible, so this costs no space on the same filesystem). A cached entry
+    is returned while each output it lists either still exists with the
+    modification time recorded when it was stored, or can be put back from
+    the store.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the cache index.
+
+        Args:
+            db_path: Path to the SQLite index (defaults to default_cache_path())
+        """
+        self.db_path = Path(db_path) if db_path else default_cache_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.store_dir = self.db_path.parent / "outputs"
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            # WAL lets worker processes read while another one writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS conversions ("
+                "key TEXT PRIMARY KEY, "
+                "result TEXT NOT NULL, "
+                "outputs TEXT NOT NULL, "
+                "created REAL NOT NULL)"
+            )
+
+        logger.debug("Conversion cache opened: %s", self.db_path)
+
+    @staticmethod
+    def fingerprint(path: Union[str, Path]) -> str:
+        """
+        Compute a content fingerprint for a file.
+
+        Small files are hashed in full. Large files are identified by their
+        size, modification time and first/last 64 KiB, which avoids reading
+        the whole document on every lookup.
+
+        Args:
+            path: File path
+
+        Returns:
+            Hex digest identifying the file content
+        """
+        stat = os.stat(path)
+        digest = hashlib.sha256()
+
+        with open(path, "rb") as f:
+            if stat.st_size <= _FULL_HASH_LIMIT:
+                for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            else:
+                digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+                digest.update(f.read(_EDGE_CHUNK_SIZE))
+                f.seek(-_EDGE_CHUNK_SIZE, os.SEEK_END)
+                digest.update(f.read(_EDGE_CHUNK_SIZE))
+
+        return digest.hexdigest()
+
+    def key(self, path: Union[str, Path], target_format: str, **params: Any) -> str:
+        """
+        Build the cache key for converting a file with the given parameters.
+
+        Args:
+            path: Input file path
+            target_format: Target format
+            **params: Additional parameters that affect the output; mappings
+                are compared by their items
+
+        Returns:
+            Cache key
+        """
+        payload = json.dumps(
+            [self.fingerprint(path), target_format, params],
+            sort_keys=True,
+            default=_json_default,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached conversion result.
+
+        Outputs that were deleted or modified since the conversion are put
+        back from the store.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored result, or None if missing or an output could not be
+            restored
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, outputs FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        result, outputs = row
+        for index, (output_path, mtime_ns) in enumerate(json.loads(outputs)):
+            try:
+                if os.stat(output_path).st_mtime_ns == mtime_ns:
+                    continue
+            except OSError:
+                pass
+            if not self._restore(key, index, output_path, mtime_ns):
+                break
+        else:
+            return json.loads(result)
+
+        # The stored copy is gone or was modified too; forget the entry
+        self.invalidate(key)
+        return None
+
+    def _stored_output(self, key: str, index: int, output_path: str) -> Path:
+        """
+        Get the store location of one output of a cached conversion.
+
+        Args:
+            key: Cache key
+            index: Position of the output in the conversion's outputs
+            output_path: Original output path
+
+        Returns:
+            Path inside the output store
+        """
+        return self.store_dir / key / f"{index}{Path(output_path).suffix}"
+
+    def _restore(self, key: str, index: int, output_path: str, mtime_ns: int) -> bool:
+        """
+        Put a stored output back at its original path.
+
+        Args:
+            key: Cache key
+            index: Position of the output in the conversion's outputs
+            output_path: Original output path
+            mtime_ns: Modification time recorded when the output was stored
+
+        Returns:
+            True if the output was restored
+        """
+        stored = self._stored_output(key, index, output_path)
+        try:
+            # Outputs are hard links, so an edit of the output in place
+            # shows up on the stored copy as well
+            if os.stat(stored).st_mtime_ns != mtime_ns:
+                return False
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            _place(stored, output_path)
+        except OSError:
+            return False
+
+        logger.debug("Restored cached output: %s", output_path)
+        return True
+
+    def put(self, key: str, result: Dict[str, Any], outputs: List[str]) -> None:
+        """
+        Store a conversion result and keep its outputs in the store.
+
+        Args:
+            key: Cache key
+            result: Result information to return on later hits
+            outputs: Files produced by the conversion
+
+        Raises:
+            OSError: If an output cannot be read or stored
+        """
+        recorded = [[str(path), os.stat(path).st_mtime_ns] for path in outputs]
+
+        store = self.store_dir / key
+        store.mkdir(parents=True, exist_ok=True)
+        for index, (output_path, _) in enumerate(recorded):
+            _place(output_path, self._stored_output(key, index, output_path))
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result), json.dumps(recorded), time.time()),
+            )
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a cached conversion.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM conversions WHERE key = ?", (key,))
+        shutil.rmtree(self.store_dir / key, ignore_errors=True)
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._conn.close()
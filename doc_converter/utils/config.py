@@ -2,43 +2,114 @@
 Configuration management utilities.
 """
 
+import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 
-import yaml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 logger = logging.getLogger(__name__)
 
 
+def _freeze(data: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Build a read-only view of a nested configuration.
+
+    Args:
+        data: Nested configuration dictionary
+
+    Returns:
+        MappingProxyType whose nested sections are read-only as well
+    """
+    return MappingProxyType(
+        {
+            key: _freeze(value) if isinstance(value, Mapping) else value
+            for key, value in data.items()
+        }
+    )
+
+
+def _thaw(data: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a (possibly read-only) nested configuration into plain dictionaries.
+
+    Args:
+        data: Nested configuration mapping
+
+    Returns:
+        Independent nested dictionary
+    """
+    return {
+        key: _thaw(value) if isinstance(value, Mapping) else value
+        for key, value in data.items()
+    }
+
+
+def _flatten(data: Mapping[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Index every section and value of a nested configuration by dotted key.
+
+    Args:
+        data: Nested configuration mapping
+        prefix: Dotted key of ``data`` itself ('' for the root)
+
+    Returns:
+        Dictionary mapping keys like 'output.image_format' to their values;
+        section keys like 'output' map to the nested dictionaries themselves
+    """
+    flat = {}
+    for key, value in data.items():
+        dotted = f"{prefix}{key}"
+        flat[dotted] = value
+        if isinstance(value, Mapping):
+            flat.update(_flatten(value, f"{dotted}."))
+    return flat
+
+
 class Config:
     """
     Configuration manager for the document converter.
     """
 
-    DEFAULT_CONFIG = {
-        "output": {
-            "image_format": "jpeg",
-            "image_quality": 95,
-            "image_dpi": 200,
-            "pdf_quality": "high",
-        },
-        "conversion": {"batch_size": 10, "timeout": 300, "max_workers": 4},
-        "paths": {"temp_dir": "./temp", "output_dir": "./output"},
-        "logging": {
-            "level": "INFO",
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        },
-        "libreoffice": {"timeout": 300, "headless": True},
-        "wkhtmltopdf": {
-            "page_size": "A4",
-            "margin_top": "0.75in",
-            "margin_right": "0.75in",
-            "margin_bottom": "0.75in",
-            "margin_left": "0.75in",
-            "encoding": "UTF-8",
-        },
-    }
+    # Read-only, so every instance can share it (and its lookup index) until
+    # it loads a file or sets a value
+    DEFAULT_CONFIG = _freeze(
+        {
+            "output": {
+                "image_format": "jpeg",
+                "image_quality": 95,
+                "image_dpi": 200,
+                "jpeg_optimize": True,
+                "jpeg_progressive": True,
+                "grayscale": False,
+                "renderer": "auto",
+                "page_cache": False,
+                "pdf_quality": "high",
+            },
+            "conversion": {"batch_size": 10, "timeout": 300, "max_workers": 4},
+            "paths": {"temp_dir": "./temp", "output_dir": "./output"},
+            "logging": {
+                "level": "INFO",
+                "format": (
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                ),
+            },
+            "libreoffice": {"timeout": 300, "headless": True, "daemon": True},
+            "wkhtmltopdf": {
+                "page_size": "A4",
+                "margin_top": "0.75in",
+                "margin_right": "0.75in",
+                "margin_bottom": "0.75in",
+                "margin_left": "0.75in",
+                "encoding": "UTF-8",
+            },
+        }
+    )
 
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         """
@@ -47,7 +118,8 @@ class Config:
         Args:
             config_path: Path to configuration file (optional)
         """
-        self.config_data = self.DEFAULT_CONFIG.copy()
+        self._config_data: Optional[Dict[str, Any]] = None
+        self._flat = _DEFAULT_FLAT
 
         if config_path:
             self.load_from_file(config_path)
@@ -55,16 +127,52 @@ class Config:
         self._setup_logging()
         logger.info("Configuration initialized")
 
+    @property
+    def config_data(self) -> Mapping[str, Any]:
+        """
+        Nested configuration; read-only while it still equals the defaults.
+        """
+        if self._config_data is None:
+            return self.DEFAULT_CONFIG
+        return self._config_data
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the configuration; the read-only views can't be."""
+        return {"_config_data": self._config_data}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled configuration and rebuild its lookup index."""
+        self._config_data = state["_config_data"]
+        self._flat = _flatten(self.config_data)
+
+    def _writable_data(self) -> Dict[str, Any]:
+        """
+        Get this instance's own copy of the configuration, making it on the
+        first change.
+
+        Returns:
+            Mutable nested configuration dictionary
+        """
+        if self._config_data is None:
+            self._config_data = _thaw(self.DEFAULT_CONFIG)
+        return self._config_data
+
     def load_from_file(self, config_path: Union[str, Path]) -> None:
         """
-        Load configuration from YAML file.
+        Load configuration from a YAML, JSON or TOML file.
+
+        .json and .toml files are parsed by the standard library (TOML needs
+        Python 3.11+); anything else is read as YAML, with libyaml's C
+        loader when PyYAML was built with it.
 
         Args:
             config_path: Path to configuration file
 
         Raises:
             FileNotFoundError: If config file doesn't exist
-            yaml.YAMLError: If config file is invalid
+            yaml.YAMLError: If a YAML config file is invalid
+            ValueError: If a JSON or TOML config file is invalid, or TOML
+                is not supported by this Python
         """
         config_path = Path(config_path)
 
@@ -73,38 +181,75 @@ class Config:
                 f"Configuration file not found: {config_path}"
             )
 
+        import yaml
+
+        suffix = config_path.suffix.lower()
+
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                user_config = yaml.safe_load(f)
+            if suffix == ".json":
+                with open(config_path, "r", encoding="utf-8") as f:
+                    user_config = json.load(f)
+            elif suffix == ".toml":
+                if tomllib is None:
+                    raise ValueError(
+                        "TOML configuration files need Python 3.11 or newer"
+                    )
+                with open(config_path, "rb") as f:
+                    user_config = tomllib.load(f)
+            else:
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                with open(config_path, "r", encoding="utf-8") as f:
+                    user_config = yaml.load(f, Loader=loader)
 
             if user_config:
-                self._merge_config(self.config_data, user_config)
-                logger.info(f"Loaded configuration from: {config_path}")
+                self._merge_config(self._writable_data(), user_config)
+                self._flat = _flatten(self.config_data)
+                logger.info("Loaded configuration from: %s", config_path)
 
-        except yaml.YAMLError as e:
-            logger.error(f"Invalid YAML in config file: {e}")
+        except (yaml.YAMLError, ValueError) as e:
+            logger.error("Invalid config file %s: %s", config_path, e)
             raise
 
     def save_to_file(self, config_path: Union[str, Path]) -> None:
         """
-        Save current configuration to YAML file.
+        Save current configuration to a YAML or JSON file.
+
+        .json paths are written as JSON; anything else as YAML.
 
         Args:
             config_path: Path where to save configuration
+
+        Raises:
+            ValueError: If asked to write TOML, which the standard library
+                can only read
         """
         config_path = Path(config_path)
+        suffix = config_path.suffix.lower()
+        if suffix == ".toml":
+            raise ValueError("Saving configuration as TOML is not supported")
+
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
+        import yaml
+
         try:
             with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    self.config_data, f, default_flow_style=False, indent=2
-                )
-
-            logger.info(f"Configuration saved to: {config_path}")
+                if suffix == ".json":
+                    json.dump(_thaw(self.config_data), f, indent=2)
+                else:
+                    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                    yaml.dump(
+                        _thaw(self.config_data),
+                        f,
+                        Dumper=dumper,
+                        default_flow_style=False,
+                        indent=2,
+                    )
+
+            logger.info("Configuration saved to: %s", config_path)
 
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
             raise
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -116,17 +261,10 @@ class Config:
             default: Default value if key not found
 
         Returns:
-            Configuration value
+            Configuration value; a whole section is a read-only mapping
+            while the configuration still equals the defaults
         """
-        keys = key.split(".")
-        value = self.config_data
-
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -137,7 +275,7 @@ class Config:
             value: Value to set
         """
         keys = key.split(".")
-        config = self.config_data
+        config = self._writable_data()
 
         # Navigate to parent of final key
         for k in keys[:-1]:
@@ -145,9 +283,11 @@ class Config:
                 config[k] = {}
             config = config[k]
 
-        # Set final value
+        # Set final value and refresh the lookup index, since the value may
+        # replace or add a whole section
         config[keys[-1]] = value
-        logger.debug(f"Set configuration: {key} = {value}")
+        self._flat = _flatten(self.config_data)
+        logger.debug("Set configuration: %s = %s", key, value)
 
     def _merge_config(
         self, base: Dict[str, Any], override: Dict[str, Any]
@@ -190,42 +330,46 @@ class Config:
         Get output-related configuration.
 
         Returns:
-            Dictionary with output configuration
+            Independent copy of the output settings; change them with set()
         """
-        return self.get("output", {})
+        return _thaw(self.get("output", {}))
 
     def get_conversion_config(self) -> Dict[str, Any]:
         """
         Get conversion-related configuration.
 
         Returns:
-            Dictionary with conversion configuration
+            Independent copy of the conversion settings; change them with set()
         """
-        return self.get("conversion", {})
+        return _thaw(self.get("conversion", {}))
 
     def get_paths_config(self) -> Dict[str, Any]:
         """
         Get paths-related configuration.
 
         Returns:
-            Dictionary with paths configuration
+            Independent copy of the paths settings; change them with set()
         """
-        return self.get("paths", {})
+        return _thaw(self.get("paths", {}))
 
     def get_libreoffice_config(self) -> Dict[str, Any]:
         """
         Get LibreOffice-related configuration.
 
         Returns:
-            Dictionary with LibreOffice configuration
+            Independent copy of the LibreOffice settings; change them with set()
         """
-        return self.get("libreoffice", {})
+        return _thaw(self.get("libreoffice", {}))
 
     def get_wkhtmltopdf_config(self) -> Dict[str, Any]:
         """
         Get wkhtmltopdf-related configuration.
 
         Returns:
-            Dictionary with wkhtmltopdf configuration
+            Independent copy of the wkhtmltopdf settings; change them with set()
         """
-        return self.get("wkhtmltopdf", {})
+        return _thaw(self.get("wkhtmltopdf", {}))
+
+
+# Lookup index shared by every Config that only uses the defaults
+_DEFAULT_FLAT = _flatten(Config.DEFAULT_CONFIG)
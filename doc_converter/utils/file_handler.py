@@ -2,14 +2,169 @@
 File handling utilities.
 """
 
+import errno
+import fnmatch
+import functools
 import logging
+import mmap
 import os
+import re
 import shutil
+import sys
+import time
 from pathlib import Path
-from typing import List, Union
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Buffer for the userspace copy fallback, and the smallest chunk requested
+# from the kernel copy calls
+_COPY_BUFFER_SIZE = 1 << 20
+# Largest count the kernel copy calls accept on every platform
+_MAX_COPY_CHUNK = 1 << 30
+
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+# Characters not allowed in file names on common filesystems
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_directory(path: Path) -> Path:
+    """
+    Create a directory (and parents) once per process.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        The same path
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[Pattern[str]]:
+    """
+    Combine glob-style patterns into one case-sensitive regular expression.
+
+    Args:
+        patterns: Glob-style patterns
+
+    Returns:
+        Compiled alternation of the patterns, or None if there are none
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _split_literal_prefix(pattern: str) -> Tuple[str, List[str]]:
+    """
+    Split a glob pattern into its wildcard-free leading path and the rest.
+
+    Args:
+        pattern: Glob-style pattern using '/' as separator
+
+    Returns:
+        Tuple of the literal prefix ('' if the first component already has
+        wildcards) and the remaining components (empty if none have any)
+    """
+    components = pattern.split("/")
+    for index, component in enumerate(components):
+        if any(char in component for char in "*?["):
+            return "/".join(components[:index]), components[index:]
+    return pattern, []
+
+
+class _GiveupOnFastCopy(Exception):
+    """
+    A kernel copy call is unusable for this pair of files and nothing has
+    been copied yet, so the next method can take over.
+    """
+
+
+def _kernel_copy(
+    copy_chunk: Callable[[int, int, int, int], int], src_fd: int, dst_fd: int
+) -> None:
+    """
+    Copy a whole file with a kernel-side copy call.
+
+    Args:
+        copy_chunk: Function taking (src_fd, dst_fd, offset, count) and
+            returning the number of bytes copied
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+
+    Raises:
+        _GiveupOnFastCopy: If the call fails or copies nothing on its first
+            use
+        OSError: If the copy fails part way through, or the disk is full
+    """
+    size = os.fstat(src_fd).st_size
+    chunk = min(max(size, _COPY_BUFFER_SIZE), _MAX_COPY_CHUNK)
+    offset = 0
+    while True:
+        try:
+            copied = copy_chunk(src_fd, dst_fd, offset, chunk)
+        except OSError as e:
+            if offset == 0 and e.errno != errno.ENOSPC:
+                raise _GiveupOnFastCopy(e) from e
+            raise
+        if copied == 0:
+            # Some filesystems report nothing to copy instead of failing
+            if offset == 0:
+                raise _GiveupOnFastCopy()
+            return
+        offset += copied
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Reserve a large file's blocks up front so it is written in few extents.
+
+    Args:
+        fd: Descriptor of the (empty) destination file
+        size: Final file size in bytes
+    """
+    if size < _COPY_BUFFER_SIZE or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        # Not supported by the filesystem; running out of space will
+        # still be reported by the copy itself
+        pass
+
+
+# copy_file_range needs Python 3.8 built against glibc 2.27 or newer
+_KERNEL_COPY_CALLS = (
+    (_copy_file_range, _sendfile) if hasattr(os, "copy_file_range") else (_sendfile,)
+)
+
+
+class _MappedFile(mmap.mmap):
+    """
+    Read-only memory map usable wherever a binary file object is expected.
+
+    mmap already provides read/seek/tell; zipfile (used by mammoth) also
+    asks whether the object is seekable.
+    """
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
 
 class FileHandler:
     """
@@ -27,9 +182,26 @@ class FileHandler:
         Returns:
             Path object for the directory
         """
-        path = Path(path)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        os.makedirs(path, exist_ok=True)
+        return Path(path)
+
+    @staticmethod
+    def ensure_directory_cached(path: Union[str, Path]) -> Path:
+        """
+        Ensure a directory exists, skipping the mkdir call for directories
+        already created by this process.
+
+        Only use this for output directories that are not removed while
+        the process runs, such as the per-file directories of a batch; the
+        public converter APIs use ensure_directory.
+
+        Args:
+            path: Directory path
+
+        Returns:
+            Path object for the directory
+        """
+        return _make_directory(Path(path))
 
     @staticmethod
     def clean_filename(filename: str) -> str:
@@ -42,13 +214,9 @@ class FileHandler:
         Returns:
             Cleaned filename
         """
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-
-        # Remove leading/trailing dots and spaces
-        filename = filename.strip(". ")
+        # Replace invalid characters and remove leading/trailing dots and
+        # spaces
+        filename = filename.translate(_INVALID_FILENAME_CHARS).strip(". ")
 
         # Limit length
         if len(filename) > 255:
@@ -69,7 +237,62 @@ class FileHandler:
         Returns:
             File size in bytes
         """
-        return Path(path).stat().st_size
+        return os.path.getsize(path)
+
+    @staticmethod
+    def prefetch(path: Union[str, Path]) -> None:
+        """
+        Hint the operating system to start reading a file into the page cache.
+
+        The read-ahead happens in the background, so a later open/read of the
+        file (by this process or a converter subprocess) hits memory instead
+        of disk. This is a no-op where posix_fadvise is unavailable or the
+        file cannot be opened.
+
+        Args:
+            path: File path
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def open_mapped(path: Union[str, Path]) -> mmap.mmap:
+        """
+        Memory-map a file read-only.
+
+        Pages are loaded by the kernel on demand, so the file is never copied
+        into a Python bytes object. The returned map behaves like a binary
+        file object; close it (or use it as a context manager) to release the
+        mapping.
+
+        Args:
+            path: File path
+
+        Returns:
+            Read-only memory map of the file
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is empty
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            return _MappedFile(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            # The mapping keeps its own reference to the file
+            os.close(fd)
 
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
@@ -85,15 +308,11 @@ class FileHandler:
         if size_bytes == 0:
             return "0 B"
 
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(size_bytes)
-
-        while size >= 1024.0 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
+        # Each unit is 2**10 of the previous one, so the bit length picks it
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+        size = size_bytes / (1 << (i * 10))
 
-        return f"{size:.1f} {size_names[i]}"
+        return f"{size:.1f} {_SIZE_NAMES[i]}"
 
     @staticmethod
     def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> Path:
@@ -107,19 +326,134 @@ class FileHandler:
         Returns:
             Destination path
         """
-        src = Path(src)
-        dst = Path(dst)
+        src, dst = FileHandler._prepare_transfer(src, dst)
+
+        FileHandler._transfer(FileHandler._fastcopy, src, dst)
+        shutil.copystat(src, dst)
+        logger.info("Copied file: %s -> %s", src, dst)
+
+        return Path(dst)
+
+    @staticmethod
+    def _prepare_transfer(
+        src: Union[str, Path], dst: Union[str, Path]
+    ) -> Tuple[str, str]:
+        """
+        Resolve the destination of a copy or move.
+
+        Works on plain strings so per-file calls don't build Path objects.
+        A missing source is left for the copy or rename itself to report.
+
+        Args:
+            src: Source file path
+            dst: Destination file path or existing directory
+
+        Returns:
+            Tuple of the source and final destination paths as strings
+        """
+        src = os.fspath(src)
+        dst = os.fspath(dst)
+
+        # Copy or move into a directory like shutil does
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+
+        return src, dst
+
+    @staticmethod
+    def _transfer(operation: Callable[[str, str], None], src: str, dst: str) -> None:
+        """
+        Run a copy or move, creating the destination's directory only when
+        the first attempt finds it missing.
+
+        Batches usually write many files into a few existing directories,
+        so this saves a mkdir per file without caching directories that
+        might be removed later.
+
+        Args:
+            operation: Function taking (src, dst)
+            src: Source file path
+            dst: Destination file path
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+        """
+        try:
+            operation(src, dst)
+        except FileNotFoundError as e:
+            # Only a failed call pays for working out what was missing
+            if not os.path.lexists(src):
+                raise FileNotFoundError(f"Source file not found: {src}") from e
+            parent = os.path.dirname(dst)
+            if not parent or os.path.isdir(parent):
+                raise
+            os.makedirs(parent, exist_ok=True)
+            operation(src, dst)
 
-        if not src.exists():
-            raise FileNotFoundError(f"Source file not found: {src}")
+    @staticmethod
+    def _fastcopy(
+        src: Union[str, Path], dst: Union[str, Path], exclusive: bool = False
+    ) -> None:
+        """
+        Copy file contents, moving the data inside the kernel when possible.
 
-        # Ensure destination directory exists
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        On Linux copy_file_range is tried first (it can reflink or copy on
+        the server for CoW filesystems and NFS), then sendfile, then a
+        read/write loop with a 1 MiB buffer. The latter two write every
+        block, so for files of 1 MiB or more the destination is
+        preallocated before them. Elsewhere shutil.copyfile
+        already uses the native call (fcopyfile on macOS, CopyFile2 on
+        Windows). Metadata is not copied.
 
-        shutil.copy2(src, dst)
-        logger.info(f"Copied file: {src} -> {dst}")
+        Args:
+            src: Source file path
+            dst: Destination file path
+            exclusive: Fail instead of overwriting an existing destination
 
-        return dst
+        Raises:
+            FileExistsError: If exclusive is set and the destination exists;
+                otherwise a failed exclusive copy removes the destination
+        """
+        # Set once an exclusive copy has claimed dst, so a failed copy
+        # doesn't leave an empty or partial file holding the name
+        claimed = False
+        try:
+            if sys.platform != "linux":
+                if exclusive:
+                    # Claim the name atomically before copyfile truncates it
+                    open(dst, "xb").close()
+                    claimed = True
+                shutil.copyfile(src, dst)
+                return
+
+            dst_mode = "xb" if exclusive else "wb"
+            with open(src, "rb") as fsrc, open(dst, dst_mode) as fdst:
+                claimed = exclusive
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+                for copy_chunk in _KERNEL_COPY_CALLS:
+                    if copy_chunk is _sendfile:
+                        # From here on this host writes every block itself
+                        _preallocate(dst_fd, os.fstat(src_fd).st_size)
+                    try:
+                        _kernel_copy(copy_chunk, src_fd, dst_fd)
+                        return
+                    except _GiveupOnFastCopy:
+                        continue
+
+                buffer = memoryview(bytearray(_COPY_BUFFER_SIZE))
+                while True:
+                    size = fsrc.readinto(buffer)
+                    if not size:
+                        break
+                    fdst.write(buffer[:size])
+        except BaseException:
+            if claimed:
+                try:
+                    os.unlink(dst)
+                except OSError:
+                    pass
+            raise
 
     @staticmethod
     def move_file(src: Union[str, Path], dst: Union[str, Path]) -> Path:
@@ -133,19 +467,31 @@ class FileHandler:
         Returns:
             Destination path
         """
-        src = Path(src)
-        dst = Path(dst)
+        src, dst = FileHandler._prepare_transfer(src, dst)
 
-        if not src.exists():
-            raise FileNotFoundError(f"Source file not found: {src}")
+        FileHandler._transfer(FileHandler._move, src, dst)
+        logger.info("Moved file: %s -> %s", src, dst)
 
-        # Ensure destination directory exists
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        return Path(dst)
 
-        shutil.move(src, dst)
-        logger.info(f"Moved file: {src} -> {dst}")
+    @staticmethod
+    def _move(src: str, dst: str) -> None:
+        """
+        Rename a file, copying it only across filesystems.
 
-        return dst
+        Args:
+            src: Source file path
+            dst: Destination file path
+        """
+        try:
+            # A single rename when both paths are on the same filesystem
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            FileHandler._fastcopy(src, dst)
+            shutil.copystat(src, dst)
+            os.unlink(src)
 
     @staticmethod
     def delete_file(path: Union[str, Path]) -> None:
@@ -155,10 +501,39 @@ class FileHandler:
         Args:
             path: File path to delete
         """
-        path = Path(path)
-        if path.exists():
-            path.unlink()
-            logger.info(f"Deleted file: {path}")
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return
+        logger.info("Deleted file: %s", path)
+
+    @staticmethod
+    def walk_files(
+        directory: Union[str, Path], recursive: bool = True
+    ) -> Iterator[os.DirEntry]:
+        """
+        Yield the files under a directory using a single os.scandir pass.
+
+        Directories are walked with an explicit stack and symlinked
+        directories are not followed. Entries carry the file type from the
+        directory listing, so no extra stat is needed to tell files apart.
+
+        Args:
+            directory: Directory to walk
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            Directory entries for regular files
+        """
+        stack = [os.fspath(directory)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
 
     @staticmethod
     def find_files(
@@ -169,30 +544,130 @@ class FileHandler:
         """
         Find files matching patterns in directory.
 
+        Collects and sorts the results of iter_files; use that directly to
+        start on files while the tree is still being scanned.
+
         Args:
             directory: Directory to search
             patterns: File patterns (e.g., ['*.pdf', '*.docx'])
             recursive: Whether to search recursively
 
         Returns:
-            List of matching file paths
+            Sorted list of matching file paths
+        """
+        files = sorted(FileHandler.iter_files(directory, patterns, recursive))
+        return [Path(path) for path in files]
+
+    @staticmethod
+    def iter_files(
+        directory: Union[str, Path],
+        patterns: List[str],
+        recursive: bool = True,
+    ) -> Iterator[str]:
         """
-        directory = Path(directory)
-        files = []
+        Yield files matching patterns in directory as they are found.
+
+        The tree is walked once and every name is tested against all
+        patterns at the same time. Patterns containing '/' are matched
+        against the path relative to ``directory``. Non-recursive searches
+        stat literal paths and only list the directories patterns name.
+
+        Only files match (including symlinks to files); directories never
+        do, even when their name fits a pattern. Recursive searches don't
+        descend into symlinked directories, while directories a
+        non-recursive pattern names are listed even through a symlink, as
+        glob does. Matching is case-sensitive, as with glob on POSIX.
+
+        Args:
+            directory: Directory to search
+            patterns: File patterns (e.g., ['*.pdf', '*.docx'])
+            recursive: Whether to search recursively
 
+        Yields:
+            Each matching file path once, in no particular order
+        """
+        if not recursive:
+            yield from FileHandler._find_files_flat(directory, patterns)
+            return
+
+        name_patterns = []
+        path_patterns = []
         for pattern in patterns:
-            if recursive:
-                files.extend(directory.rglob(pattern))
+            if "/" in pattern:
+                path_patterns.append(pattern)
+                path_patterns.append("*/" + pattern)
             else:
-                files.extend(directory.glob(pattern))
+                name_patterns.append(pattern)
+
+        name_regex = _compile_patterns(name_patterns)
+        path_regex = _compile_patterns(path_patterns)
 
-        return sorted(list(set(files)))
+        for entry in FileHandler.walk_files(directory, recursive):
+            if name_regex is not None and name_regex.match(entry.name):
+                yield entry.path
+            elif path_regex is not None:
+                relative = os.path.relpath(entry.path, directory)
+                if path_regex.match(relative.replace(os.sep, "/")):
+                    yield entry.path
+
+    @staticmethod
+    def _find_files_flat(directory: Union[str, Path], patterns: List[str]) -> Set[str]:
+        """
+        Resolve non-recursive patterns without walking the whole directory.
+
+        A pattern without wildcards costs a single stat. Patterns whose
+        wildcards are all in the last component are grouped by their
+        literal prefix, and each such directory is listed once with the
+        names tested against all of its patterns at the same time.
+
+        Args:
+            directory: Directory to search
+            patterns: File patterns (e.g., ['*.pdf', 'reports/*.docx'])
+
+        Returns:
+            Set of matching file paths
+        """
+        files: Set[str] = set()
+        listed: Dict[str, List[str]] = {}
+        for pattern in patterns:
+            prefix, rest = _split_literal_prefix(pattern)
+            base = os.path.join(directory, prefix)
+            if not rest:
+                if os.path.isfile(base):
+                    files.add(base)
+            elif len(rest) == 1:
+                listed.setdefault(base, []).append(rest[0])
+            else:
+                files.update(
+                    os.fspath(path)
+                    for path in Path(directory).glob(pattern)
+                    if path.is_file()
+                )
+
+        for base, name_patterns in listed.items():
+            regex = _compile_patterns(name_patterns)
+            try:
+                with os.scandir(base) as entries:
+                    files.update(
+                        entry.path
+                        for entry in entries
+                        if regex.match(entry.name) and entry.is_file()
+                    )
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+        return files
 
     @staticmethod
     def get_temp_file(suffix: str = "", prefix: str = "doc_converter_") -> Path:
         """
         Get a temporary file path.
 
+        The file has a real name so it can be handed to converter
+        subprocesses. Scratch data that never needs a name is better kept
+        in tempfile.TemporaryFile, which uses an anonymous O_TMPFILE inode
+        on Linux.
+
         Args:
             suffix: File suffix (e.g., '.pdf')
             prefix: File prefix
@@ -217,15 +692,25 @@ class FileHandler:
         Returns:
             Path to backup file
         """
-        path = Path(path)
-        backup_path = path.with_suffix(f"{path.suffix}.backup")
-
-        counter = 1
-        while backup_path.exists():
-            backup_path = path.with_suffix(f"{path.suffix}.backup.{counter}")
-            counter += 1
-
-        shutil.copy2(path, backup_path)
-        logger.info(f"Created backup: {backup_path}")
-
-        return backup_path
+        path = os.fspath(path)
+        backup_path = f"{path}.backup"
+
+        try:
+            FileHandler._fastcopy(path, backup_path, exclusive=True)
+        except FileExistsError:
+            # Name later backups by time and process instead of probing
+            # .backup.1, .backup.2, ... one stat at a time
+            stamp = f"{time.strftime('%Y%m%d%H%M%S')}.{os.getpid()}"
+            backup_path = f"{path}.backup.{stamp}"
+            while True:
+                try:
+                    FileHandler._fastcopy(path, backup_path, exclusive=True)
+                    break
+                except FileExistsError:
+                    micros = time.monotonic_ns() // 1000
+                    backup_path = f"{path}.backup.{stamp}.{micros}"
+
+        shutil.copystat(path, backup_path)
+        logger.info("Created backup: %s", backup_path)
+
+        return Path(backup_path)
@@ -1,16 +1,52 @@
 # requirements
 # sudo apt install unoconv
 # pip install tqdm
-# pip install glob
-import glob
-import tqdm
+import multiprocessing
 import os
+import subprocess
+import tempfile
+
+import tqdm
 
 path = "documents"
-files = [f for f in glob.glob(path + "**/*.pptx", recursive=True)]
-for f in tqdm.tqdm(files):
-    command = 'unoconv -f pdf "{}"'.format(f)
-    os.system(command)
+# Each worker gets its own unoconv listener port and LibreOffice profile so
+# parallel conversions neither share one instance nor fight over the
+# profile lock
+BASE_PORT = 2002
+
+
+def find_pptx(directory):
+    for entry in os.scandir(directory):
+        if entry.is_dir(follow_symlinks=False):
+            yield from find_pptx(entry.path)
+        elif entry.name.endswith(".pptx"):
+            yield entry.path
+
+
+def init_worker(counter, profile_root):
+    global port, profile
+    with counter.get_lock():
+        n = counter.value
+        counter.value += 1
+    port = BASE_PORT + n
+    profile = os.path.join(profile_root, f"lo_{n}")
+
+
+def convert(f):
+    return subprocess.run(
+        ["unoconv", "-p", str(port), f"--user-profile={profile}", "-f", "pdf", f],
+        check=False,
+    )
 
 
-## WELL TESTED FOR UBUNTU , WORKS PERFECTLY
+if __name__ == "__main__":
+    files = list(find_pptx(path))
+    counter = multiprocessing.Value("i", 0)
+    workers = max(1, multiprocessing.cpu_count() - 1)
+    # The profiles are removed once every worker has finished
+    with tempfile.TemporaryDirectory(prefix="unoconv_profiles_") as profile_root:
+        with multiprocessing.Pool(
+            workers, init_worker, (counter, profile_root)
+        ) as pool:
+            for _ in tqdm.tqdm(pool.imap_unordered(convert, files), total=len(files)):
+                pass
@@ -1,31 +1,65 @@
+import contextlib
+import os
+import socket
 import subprocess as sp
+import tempfile
+import time
+from pathlib import Path
 
 sp.run("clear")
 # sp.run("echo 'Hello World'", shell=True)
 # sp.run("pwd")
 
-# Convert docx to pdf
-sp.run(
-    ["lowriter", "--convert-to", "pdf", "sample.docx", "--outdir", "./results/doc2pdf"]
-)
+# One LibreOffice is started up front and every conversion is sent to it
+# through unoconv, so startup is paid once for the whole script
+HOST, PORT = "localhost", 2002
+CONNECTION = f"socket,host={HOST},port={PORT};urp;"
+STARTUP_TIMEOUT = 60
 
-# convert multiple docx to pdf
-# sp.run(["lowriter", "--convert-to", "pdf", "*.docx"])
+# Files to convert, grouped by output directory. unoconv accepts many
+# inputs per call (e.g. add "*.docx" matches to the first list).
+conversions = {
+    # Convert docx to pdf
+    "./results/doc2pdf": ["sample.docx"],
+    # Convert ppts to pdf
+    "./results/ppt2pdf": ["sample.pptx"],
+    # convert text file to pdf
+    "results/txt2pdf": ["sample.txt"],
+}
 
-# Convert ppts to pdf
-sp.run(
-    ["lowriter", "--convert-to", "pdf", "sample.pptx", "--outdir", "./results/ppt2pdf"]
-)
+with contextlib.ExitStack() as stack:
+    # A private profile keeps this instance from handing the work to (or
+    # clashing with) a LibreOffice the user already has open
+    profile = stack.enter_context(tempfile.TemporaryDirectory())
+    office = sp.Popen(
+        [
+            "soffice",
+            "--headless",
+            "--invisible",
+            "--norestore",
+            "--nofirststartwizard",
+            f"-env:UserInstallation={Path(profile).as_uri()}",
+            f"--accept={CONNECTION}",
+        ]
+    )
+    # Shut LibreOffice down even if a conversion fails
+    stack.callback(office.wait)
+    stack.callback(office.terminate)
 
-# convert multiple ppts to pdf
-# sp.run(["lowriter", "--convert-to", "pdf", "*.pptx"])
+    # unoconv gives up if LibreOffice isn't listening yet, so wait for the
+    # socket before sending any work
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while True:
+        try:
+            with socket.create_connection((HOST, PORT), timeout=1):
+                break
+        except OSError:
+            if office.poll() is not None or time.monotonic() > deadline:
+                raise SystemExit("LibreOffice did not start listening")
+            time.sleep(0.25)
 
-
-# convert text file to pdf
-sp.run(
-    ["lowriter", "--convert-to", "pdf", "sample.txt", "--outdir", "results/txt2pdf"],
-)
-
-# convert multiple text files to pdf
-
-# sp.run(["lowriter", "--convert-to", "pdf", "*.txt"])
+    for outdir, files in conversions.items():
+        os.makedirs(outdir, exist_ok=True)
+        sp.run(
+            ["unoconv", "--connection", CONNECTION, "-f", "pdf", "-o", outdir, *files]
+        )
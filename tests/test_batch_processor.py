@@ -0,0 +1,321 @@
+"""
+Tests for batch processing functionality.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from doc_converter.core import batch_processor
+from doc_converter.core.batch_processor import (
+    BatchProcessor,
+    _convert_file,
+    _init_worker,
+)
+from doc_converter.core.document_converter import DocumentConverter
+from doc_converter.core.pdf_converter import PDFConverter
+from doc_converter.utils.cache import ConversionCache
+from doc_converter.utils.config import Config
+
+
+def report_worker_id(delay):
+    """Pool task returning the worker process and the slot it claimed."""
+    time.sleep(delay)
+    return os.getpid(), batch_processor._worker_id
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    """Nine small DOCX stand-ins of different sizes."""
+    files = []
+    for i in range(9):
+        path = tmp_path / "in" / f"doc{i}.docx"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"x" * (i + 1))
+        files.append(path)
+    return files
+
+
+def fake_convert_file(
+    converter, input_file, output_dir, target_format, cache, worker_id=None
+):
+    """Stand-in for _convert_file failing on doc0 and passing otherwise."""
+    if input_file.name == "doc0.docx":
+        raise RuntimeError("corrupt document")
+    return {"input_file": str(input_file), "type": "single_file"}
+
+
+@pytest.fixture
+def make_processor():
+    """Build BatchProcessors around a DocumentConverter stand-in."""
+    with patch(
+        "doc_converter.core.batch_processor.DocumentConverter",
+        return_value=Mock(spec=DocumentConverter),
+    ):
+        yield lambda **kwargs: BatchProcessor(**kwargs)
+
+
+class TestConversionCaching:
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Conversion cache in a temporary directory."""
+        cache = ConversionCache(tmp_path / "cache" / "index.sqlite")
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def converter(self):
+        """DocumentConverter stand-in writing one page per conversion."""
+        converter = Mock(spec=DocumentConverter)
+        converter.config = Config()
+
+        def fake_pdf_to_images(input_file, output_dir, target_format):
+            page = Path(output_dir) / f"page_001.{target_format}"
+            page.write_bytes(b"page")
+            return [str(page)]
+
+        converter.pdf_to_images.side_effect = fake_pdf_to_images
+        return converter
+
+    def test_config_change_misses_cache(self, converter, cache, tmp_path):
+        """Test a conversion is only reused with the same settings."""
+        input_file = tmp_path / "doc.pdf"
+        input_file.write_bytes(b"%PDF-1.4 doc")
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        _convert_file(converter, input_file, output_dir, "jpeg", cache)
+        _convert_file(converter, input_file, output_dir, "jpeg", cache)
+        assert converter.pdf_to_images.call_count == 1
+
+        converter.config.set("output.grayscale", True)
+        _convert_file(converter, input_file, output_dir, "jpeg", cache)
+        assert converter.pdf_to_images.call_count == 2
+
+
+class TestWorkerProcess:
+
+    def test_init_worker_renders_in_process(self):
+        """Test pool workers don't split PDFs across further processes."""
+        converter = Mock(spec=DocumentConverter)
+        converter.pdf_converter = PDFConverter()
+
+        with patch(
+            "doc_converter.core.batch_processor._get_converter",
+            return_value=converter,
+        ), patch("doc_converter.core.batch_processor._get_cache"):
+            _init_worker()
+
+        assert converter.pdf_converter.thread_count == 1
+        assert converter.pdf_converter._default_thread_count() == 1
+
+
+class TestExecutorSelection:
+
+    @pytest.mark.parametrize(
+        "executor_type,target_format,expected",
+        [
+            ("auto", "jpeg", True),
+            ("auto", "png", True),
+            ("auto", "pdf", False),
+            ("auto", "html", False),
+            ("process", "pdf", True),
+            ("process", "jpeg", True),
+            ("thread", "jpeg", False),
+            ("thread", "html", False),
+        ],
+    )
+    def test_use_processes(
+        self, make_processor, executor_type, target_format, expected
+    ):
+        """Test which pool each executor option picks for each format."""
+        processor = make_processor(executor_type=executor_type)
+
+        assert processor._use_processes(target_format) is expected
+
+    def test_unknown_executor_type(self, make_processor):
+        """Test an unknown executor option is rejected up front."""
+        with pytest.raises(ValueError, match="Unsupported executor type"):
+            make_processor(executor_type="fiber")
+
+    @pytest.mark.parametrize(
+        "use_processes,executor_class",
+        [(True, ProcessPoolExecutor), (False, ThreadPoolExecutor)],
+    )
+    def test_create_executor(self, make_processor, use_processes, executor_class):
+        """Test the executor matches the pool type chosen."""
+        processor = make_processor(max_workers=2)
+
+        with processor._create_executor(use_processes) as executor:
+            assert isinstance(executor, executor_class)
+            assert executor._max_workers == 2
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="the patched converter only reaches forked workers",
+    )
+    def test_process_worker_ids_unique(self, make_processor):
+        """Test every pool process claims a different worker slot."""
+        processor = make_processor(max_workers=3)
+
+        with patch("doc_converter.core.batch_processor._get_converter"):
+            with processor._create_executor(True) as executor:
+                # Overlapping tasks make the pool start all three workers
+                futures = [executor.submit(report_worker_id, 0.2) for _ in range(6)]
+                reports = {future.result() for future in futures}
+
+        slot_by_pid = dict(reports)
+        assert len(slot_by_pid) == 3
+        assert sorted(slot_by_pid.values()) == [0, 1, 2]
+
+    def test_thread_worker_ids_unique(self, make_processor, tmp_path):
+        """Test concurrent thread conversions never share a worker slot."""
+        processor = make_processor(executor_type="thread", max_workers=3)
+        lock = threading.Lock()
+        in_use = set()
+        seen = []
+
+        def fake_convert(
+            converter, input_file, output_dir, target_format, cache, worker_id
+        ):
+            with lock:
+                assert worker_id not in in_use
+                in_use.add(worker_id)
+                seen.append(worker_id)
+            time.sleep(0.02)
+            with lock:
+                in_use.remove(worker_id)
+            return {"input_file": str(input_file)}
+
+        files = [tmp_path / f"doc{i}.docx" for i in range(9)]
+        for path in files:
+            path.write_bytes(b"docx")
+
+        with patch(
+            "doc_converter.core.batch_processor._convert_file",
+            side_effect=fake_convert,
+        ):
+            results = processor.convert_file_list(files, tmp_path, "pdf")
+
+        assert results["failed"] == 0
+        assert len(seen) == 9
+        assert set(seen) <= {0, 1, 2}
+
+
+class TestResultSink:
+
+    @pytest.fixture
+    def processor(self, make_processor):
+        """Thread-pool processor converting with fake_convert_file."""
+        with patch(
+            "doc_converter.core.batch_processor._convert_file",
+            side_effect=fake_convert_file,
+        ):
+            yield make_processor(executor_type="thread", max_workers=2)
+
+    def test_results_collected(self, processor, input_files, tmp_path):
+        """Test results are returned when no sink is given."""
+        results = processor.convert_file_list(input_files, tmp_path, "pdf")
+
+        assert results["total_files"] == 9
+        assert results["successful"] == 8
+        assert results["failed"] == 1
+        assert results["errors"] == [
+            {"file": str(input_files[0]), "error": "corrupt document"}
+        ]
+        assert sorted(r["input_file"] for r in results["results"]) == sorted(
+            str(path) for path in input_files[1:]
+        )
+
+    def test_results_streamed(self, processor, input_files, tmp_path):
+        """Test a sink receives each success instead of the results list."""
+        sink = Mock()
+
+        results = processor.convert_file_list(
+            input_files, tmp_path, "pdf", result_sink=sink
+        )
+
+        assert results["successful"] == 8
+        assert results["results"] == []
+        assert sorted(call.args[0]["input_file"] for call in sink.call_args_list) == (
+            sorted(str(path) for path in input_files[1:])
+        )
+        # Failures are still reported in the summary, not to the sink
+        assert len(results["errors"]) == 1
+
+
+class TestSubmission:
+
+    def test_window_and_order(self, make_processor, input_files, tmp_path):
+        """Test largest files go first, at most 4 per worker in flight."""
+        processor = make_processor(executor_type="thread", max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_convert(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return {"input_file": str(args[1])}
+
+        with patch(
+            "doc_converter.core.batch_processor._convert_file",
+            side_effect=blocking_convert,
+        ), patch(
+            "doc_converter.core.batch_processor.FileHandler.prefetch"
+        ) as mock_prefetch:
+            batch = threading.Thread(
+                target=processor.convert_file_list,
+                args=(input_files, tmp_path, "pdf"),
+            )
+            batch.start()
+            try:
+                assert started.wait(5)
+                time.sleep(0.05)
+                # Submission waits while the window is full
+                assert mock_prefetch.call_count == 4
+            finally:
+                release.set()
+                batch.join(5)
+
+        submitted = [call.args[0] for call in mock_prefetch.call_args_list]
+        assert submitted == sorted(
+            input_files, key=lambda path: path.stat().st_size, reverse=True
+        )
+
+
+class TestProgress:
+
+    def test_progress_throttled(self, make_processor, input_files, tmp_path):
+        """Test callbacks are rate-limited, from the caller's thread."""
+        processor = make_processor(executor_type="thread", max_workers=2)
+        calls = []
+        threads = set()
+
+        def progress(current, total, filename):
+            calls.append((current, total))
+            threads.add(threading.get_ident())
+
+        # Each completion is 20 ms after the last, so only every third one
+        # is at least 50 ms after the previous callback
+        clock = Mock()
+        clock.monotonic.side_effect = [0.02 * i for i in range(1, 10)]
+
+        with patch(
+            "doc_converter.core.batch_processor._convert_file",
+            side_effect=fake_convert_file,
+        ), patch("doc_converter.core.batch_processor.time", clock):
+            processor.convert_file_list(
+                input_files, tmp_path, "pdf", progress_callback=progress
+            )
+
+        # Failed files count towards progress, and the final update is
+        # always delivered
+        assert calls == [(3, 9), (6, 9), (9, 9)]
+        assert threads == {threading.get_ident()}
@@ -0,0 +1,56 @@
+"""
+Tests for the command line interface.
+"""
+
+import json
+from unittest.mock import patch
+
+from doc_converter.cli.main import main
+
+
+class TestBatchConvert:
+
+    def test_results_file(self, tmp_path, capsys):
+        """Test --results-file streams each result as a JSON line."""
+        results_file = tmp_path / "results.jsonl"
+        streamed = [
+            {"input_file": "a.docx", "output_file": "out/a.pdf"},
+            {"input_file": "b.docx", "output_file": "out/b.pdf"},
+        ]
+
+        def fake_convert_directory(result_sink, **kwargs):
+            for result in streamed:
+                result_sink(result)
+            return {
+                "total_files": 3,
+                "successful": 2,
+                "failed": 1,
+                "results": [],
+                "errors": [{"file": "c.docx", "error": "corrupt document"}],
+            }
+
+        argv = [
+            "doc_converter",
+            "batch-convert",
+            "--input-dir",
+            str(tmp_path),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--format",
+            "pdf",
+            "--results-file",
+            str(results_file),
+        ]
+        with patch("sys.argv", argv), patch(
+            "doc_converter.cli.main.setup_logging"
+        ), patch("doc_converter.core.batch_processor.BatchProcessor") as mock_processor:
+            mock_processor.return_value.convert_directory.side_effect = (
+                fake_convert_directory
+            )
+            main()
+
+        lines = results_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == streamed
+        output = capsys.readouterr().out
+        assert f"Results written to: {results_file}" in output
+        assert "c.docx: corrupt document" in output
@@ -0,0 +1,172 @@
+"""
+Tests for configuration management.
+"""
+
+import pickle
+
+import pytest
+import yaml
+
+from doc_converter.utils.config import Config
+
+
+class TestDefaults:
+
+    def test_default_config_frozen(self):
+        """Test the shared defaults cannot be changed in place."""
+        with pytest.raises(TypeError):
+            Config.DEFAULT_CONFIG["output"] = {}
+        with pytest.raises(TypeError):
+            Config.DEFAULT_CONFIG["output"]["image_dpi"] = 72
+
+    def test_set_copies_on_write(self):
+        """Test set() changes only its own instance, never the defaults."""
+        config = Config()
+        other = Config()
+        assert config.config_data is Config.DEFAULT_CONFIG
+
+        config.set("output.image_dpi", 72)
+
+        assert config.get("output.image_dpi") == 72
+        assert other.get("output.image_dpi") == 200
+        assert Config.DEFAULT_CONFIG["output"]["image_dpi"] == 200
+        assert other.config_data is Config.DEFAULT_CONFIG
+
+    def test_section_getters_return_copies(self):
+        """Test section getters return plain dicts safe to modify."""
+        config = Config()
+
+        output = config.get_output_config()
+        output["image_dpi"] = 72
+        conversion = config.get_conversion_config()
+        conversion["max_workers"] = 1
+
+        assert isinstance(output, dict)
+        assert config.get("output.image_dpi") == 200
+        assert config.get_conversion_config()["max_workers"] == 4
+        assert config.get_libreoffice_config()["daemon"] is True
+        assert config.get_paths_config()["temp_dir"] == "./temp"
+        assert config.get_wkhtmltopdf_config()["page_size"] == "A4"
+
+
+class TestLookupIndex:
+
+    def test_set_value(self):
+        """Test dotted lookups see a changed value and its section."""
+        config = Config()
+
+        config.set("output.image_format", "png")
+
+        assert config.get("output.image_format") == "png"
+        assert config.get("output")["image_format"] == "png"
+        assert config.get("output.image_dpi") == 200
+
+    def test_set_section(self):
+        """Test replacing a section replaces every key under it."""
+        config = Config()
+
+        config.set("wkhtmltopdf", {"page_size": "Letter"})
+
+        assert config.get("wkhtmltopdf.page_size") == "Letter"
+        assert config.get("wkhtmltopdf.margin_top") is None
+        assert config.get("wkhtmltopdf.margin_top", "1in") == "1in"
+
+    def test_set_new_nested_key(self):
+        """Test setting a key creates the sections leading to it."""
+        config = Config()
+
+        config.set("extra.nested.value", 3)
+
+        assert config.get("extra.nested.value") == 3
+        assert config.get("extra.nested") == {"value": 3}
+        assert config.get("extra.missing") is None
+
+    def test_file_update(self, tmp_path):
+        """Test values merged from a file are indexed with the defaults."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"conversion": {"max_workers": 8}}')
+        config = Config()
+        config.set("output.grayscale", True)
+
+        config.load_from_file(config_file)
+
+        assert config.get("conversion.max_workers") == 8
+        assert config.get("conversion.timeout") == 300
+        assert config.get("output.grayscale") is True
+
+    def test_pickle_rebuilds_index(self):
+        """Test a pickled configuration keeps its values."""
+        config = Config()
+        config.set("output.image_dpi", 72)
+
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored.get("output.image_dpi") == 72
+        assert restored.get("output.image_format") == "jpeg"
+        assert pickle.loads(pickle.dumps(Config())).get("output.image_dpi") == 200
+
+
+class TestConfigFiles:
+
+    @pytest.mark.parametrize(
+        "name,content",
+        [
+            ("config.yaml", "output:\n  image_dpi: 300\n"),
+            ("config.yml", "output:\n  image_dpi: 300\n"),
+            ("config.json", '{"output": {"image_dpi": 300}}'),
+            ("config.toml", "[output]\nimage_dpi = 300\n"),
+        ],
+    )
+    def test_load_formats(self, tmp_path, name, content):
+        """Test YAML, JSON and TOML files are merged over the defaults."""
+        if name.endswith(".toml"):
+            pytest.importorskip("tomllib")
+        config_file = tmp_path / name
+        config_file.write_text(content)
+
+        config = Config(config_file)
+
+        assert config.get("output.image_dpi") == 300
+        assert config.get("output.image_format") == "jpeg"
+
+    @pytest.mark.parametrize(
+        "name,content",
+        [
+            ("config.yaml", "output: [unclosed\n"),
+            ("config.json", '{"output": '),
+            ("config.toml", "[output\n"),
+        ],
+    )
+    def test_load_invalid(self, tmp_path, name, content):
+        """Test a malformed file raises and leaves the defaults alone."""
+        if name.endswith(".toml"):
+            pytest.importorskip("tomllib")
+        config_file = tmp_path / name
+        config_file.write_text(content)
+        config = Config()
+
+        with pytest.raises((yaml.YAMLError, ValueError)):
+            config.load_from_file(config_file)
+
+        assert config.config_data is Config.DEFAULT_CONFIG
+
+    def test_load_missing(self, tmp_path):
+        """Test a missing file is reported."""
+        with pytest.raises(FileNotFoundError):
+            Config(tmp_path / "missing.yaml")
+
+    @pytest.mark.parametrize("name", ["saved.yaml", "saved.json"])
+    def test_save_round_trip(self, tmp_path, name):
+        """Test a saved configuration loads back unchanged."""
+        config = Config()
+        config.set("output.image_dpi", 72)
+        path = tmp_path / "nested" / name
+
+        config.save_to_file(path)
+
+        assert Config(path).config_data == config.config_data
+
+    def test_save_toml_rejected(self, tmp_path):
+        """Test saving as TOML, which can only be read, is refused."""
+        with pytest.raises(ValueError, match="TOML"):
+            Config().save_to_file(tmp_path / "saved.toml")
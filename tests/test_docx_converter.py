@@ -2,13 +2,22 @@
 Tests for DOCX converter functionality.
 """
 
+import asyncio
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
+from fpdf import FPDF
 
-from doc_converter.core.docx_converter import DOCXConverter
+from doc_converter.core._soffice_daemon import SofficeDaemon, get_daemon
+from doc_converter.core.docx_converter import (
+    DOCXConverter,
+    _discover_libreoffice,
+    _worker_profile,
+)
 
 
 class TestDOCXConverter:
@@ -19,7 +28,10 @@ class TestDOCXConverter:
         with patch.object(
             DOCXConverter, "_find_libreoffice", return_value="libreoffice"
         ):
-            return DOCXConverter()
+            converter = DOCXConverter()
+        # Exercise the per-file subprocess path even where UNO is installed
+        converter._use_daemon = False
+        return converter
 
     @pytest.fixture
     def sample_docx_path(self):
@@ -41,22 +53,39 @@ class TestDOCXConverter:
         assert converter is not None
         assert converter.libreoffice_cmd == "libreoffice"
 
-    def test_find_libreoffice_success(self):
+    @pytest.fixture
+    def clear_discovery_cache(self):
+        """Forget any LibreOffice location found by earlier tests."""
+        _discover_libreoffice.cache_clear()
+        yield
+        _discover_libreoffice.cache_clear()
+
+    def test_find_libreoffice_success(self, clear_discovery_cache):
         """Test finding LibreOffice executable."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+        with patch("shutil.which") as mock_which:
+            mock_which.side_effect = lambda cmd: (
+                "/usr/bin/lowriter" if cmd == "lowriter" else None
+            )
 
             converter = DOCXConverter()
-            assert converter.libreoffice_cmd in ["libreoffice", "lowriter"]
+            assert converter.libreoffice_cmd == "lowriter"
 
-    def test_find_libreoffice_not_found(self):
+    def test_find_libreoffice_not_found(self, clear_discovery_cache):
         """Test LibreOffice not found."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-
+        with patch("shutil.which", return_value=None), patch(
+            "os.path.isfile", return_value=False
+        ):
             with pytest.raises(RuntimeError, match="LibreOffice not found"):
                 DOCXConverter()
 
+    def test_find_libreoffice_cached(self, clear_discovery_cache):
+        """Test LibreOffice is only looked up once per process."""
+        with patch("shutil.which", return_value="/usr/bin/libreoffice") as mock_which:
+            DOCXConverter()
+            DOCXConverter()
+
+        mock_which.assert_called_once_with("libreoffice")
+
     @patch("subprocess.run")
     def test_to_pdf_success(
         self, mock_run, converter, sample_docx_path, output_path
@@ -65,13 +94,15 @@ class TestDOCXConverter:
         # Mock successful subprocess run
         mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
 
-        # Create the expected PDF file
+        # Create the PDF LibreOffice would write, named after the input
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.touch()
+        (output_path.parent / "sample.pdf").touch()
 
         result = converter.to_pdf(sample_docx_path, output_path)
 
         assert result == str(output_path)
+        assert output_path.exists()
+        assert not (output_path.parent / "sample.pdf").exists()
         mock_run.assert_called_once()
 
         # Verify the command includes correct parameters
@@ -81,6 +112,133 @@ class TestDOCXConverter:
         assert "--convert-to" in call_args
         assert "pdf" in call_args
 
+    @patch("subprocess.run")
+    def test_to_pdf_worker_profile(
+        self, mock_run, converter, sample_docx_path, output_path
+    ):
+        """Test batch workers run LibreOffice with their own profile."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        (output_path.parent / "sample.pdf").touch()
+
+        converter.to_pdf(sample_docx_path, output_path, worker_id=2)
+
+        call_args = mock_run.call_args[0][0]
+        profile_dir = _worker_profile(2)
+        profile_uri = Path(profile_dir).as_uri()
+        assert f"-env:UserInstallation={profile_uri}" in call_args
+        assert Path(profile_dir).is_dir()
+        assert Path(profile_dir).parent == Path(tempfile.gettempdir())
+        assert _worker_profile(3) != profile_dir
+
+    def test_gather_to_pdf(self, converter, tmp_path):
+        """Test concurrent conversions each hold their own worker slot."""
+        inputs = [tmp_path / "a.docx", tmp_path / "b.docx"]
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        for name in ("a.pdf", "b.pdf"):
+            (output_dir / name).touch()
+
+        process = Mock(returncode=0)
+        process.communicate = AsyncMock(return_value=(b"", b""))
+
+        with patch(
+            "asyncio.create_subprocess_exec", AsyncMock(return_value=process)
+        ) as mock_exec:
+            result = asyncio.run(converter.gather_to_pdf(inputs, output_dir))
+
+        assert result == [str(output_dir / "a.pdf"), str(output_dir / "b.pdf")]
+        profiles = {
+            arg
+            for call in mock_exec.call_args_list
+            for arg in call.args
+            if arg.startswith("-env:UserInstallation=")
+        }
+        assert len(profiles) == 2
+
+    @patch("subprocess.run")
+    def test_to_pdf_uses_daemon(
+        self, mock_run, converter, sample_docx_path, output_path
+    ):
+        """Test DOCX to PDF conversion through the LibreOffice daemon."""
+        mock_daemon = Mock(spec=SofficeDaemon)
+
+        def fake_convert(input_path, output_path, timeout):
+            output_path.touch()
+
+        mock_daemon.convert_to_pdf.side_effect = fake_convert
+
+        with patch.object(converter, "_get_daemon", return_value=mock_daemon):
+            result = converter.to_pdf(sample_docx_path, output_path)
+
+        assert result == str(output_path)
+        mock_daemon.convert_to_pdf.assert_called_once_with(
+            sample_docx_path, output_path, timeout=300
+        )
+        mock_run.assert_not_called()
+
+    def test_to_pdf_daemon_per_worker(
+        self, converter, sample_docx_path, output_path
+    ):
+        """Test each worker slot converts through its own daemon."""
+        mock_daemon = Mock(spec=SofficeDaemon)
+        mock_daemon.convert_to_pdf.side_effect = (
+            lambda input_path, output_path, timeout: output_path.touch()
+        )
+
+        with patch.object(
+            converter, "_get_daemon", return_value=mock_daemon
+        ) as mock_get_daemon:
+            converter.to_pdf(sample_docx_path, output_path, worker_id=1)
+
+        mock_get_daemon.assert_called_once_with(1)
+        assert get_daemon("soffice", 0) is get_daemon("soffice", 0)
+        assert get_daemon("soffice", 0) is not get_daemon("soffice", 1)
+        assert get_daemon("soffice") is not get_daemon("soffice", 0)
+
+    def test_daemon_export_timeout(self, sample_docx_path, output_path):
+        """Test a hung daemon export is killed and LibreOffice restarted."""
+        daemon = SofficeDaemon("soffice")
+        daemon._process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"]
+        )
+
+        def hung_export(input_path, output_path):
+            # A pending UNO call only fails once LibreOffice goes away
+            daemon._process.wait()
+            raise RuntimeError("Binary URP bridge disposed")
+
+        try:
+            with patch.object(
+                daemon, "_export_pdf", side_effect=hung_export
+            ), patch.object(daemon, "_restart") as mock_restart:
+                with pytest.raises(RuntimeError, match="timed out"):
+                    daemon.convert_to_pdf(
+                        sample_docx_path, output_path, timeout=0.1
+                    )
+
+            mock_restart.assert_called_once()
+            assert daemon._process.poll() is not None
+        finally:
+            daemon._process.kill()
+            daemon._process.wait()
+
+    @patch("subprocess.run")
+    def test_batch_to_pdf_single_invocation(self, mock_run, converter, tmp_path):
+        """Test several files are converted by one LibreOffice run."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        inputs = [tmp_path / "a.docx", tmp_path / "b.pptx"]
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        for name in ("a.pdf", "b.pdf"):
+            (output_dir / name).touch()
+
+        result = converter.batch_to_pdf(inputs, output_dir)
+
+        assert result == [str(output_dir / "a.pdf"), str(output_dir / "b.pdf")]
+        mock_run.assert_called_once()
+        call_args = mock_run.call_args[0][0]
+        assert call_args[-2:] == [str(path) for path in inputs]
+
     @patch("subprocess.run")
     def test_to_pdf_conversion_fails(
         self, mock_run, converter, sample_docx_path, output_path
@@ -109,9 +267,16 @@ class TestDOCXConverter:
             converter.to_pdf(sample_docx_path, output_path)
 
     @patch("mammoth.convert_to_html")
+    @patch("doc_converter.core.docx_converter.FileHandler.open_mapped")
     @patch("builtins.open", new_callable=mock_open)
     def test_to_html_success(
-        self, mock_file, mock_mammoth, converter, sample_docx_path, tmp_path
+        self,
+        mock_file,
+        mock_open_mapped,
+        mock_mammoth,
+        converter,
+        sample_docx_path,
+        tmp_path,
     ):
         """Test successful DOCX to HTML conversion."""
         # Mock mammoth conversion
@@ -125,7 +290,10 @@ class TestDOCXConverter:
         result = converter.to_html(sample_docx_path, html_path)
 
         assert result == str(html_path)
-        mock_mammoth.assert_called_once()
+        mock_open_mapped.assert_called_once_with(sample_docx_path)
+        mock_mammoth.assert_called_once_with(
+            mock_open_mapped.return_value.__enter__.return_value
+        )
         mock_file.assert_called()
 
     @patch(
@@ -137,8 +305,8 @@ class TestDOCXConverter:
         self, mock_file, converter, sample_txt_path, output_path
     ):
         """Test successful TXT to PDF conversion."""
-        with patch("doc_converter.core.docx_converter.FPDF") as mock_fpdf:
-            mock_pdf_instance = Mock()
+        with patch("fpdf.FPDF") as mock_fpdf:
+            mock_pdf_instance = Mock(spec=FPDF)
             mock_fpdf.return_value = mock_pdf_instance
 
             # Make the output file exist after conversion
@@ -0,0 +1,211 @@
+"""
+Tests for file handling utilities.
+"""
+
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from doc_converter.utils import file_handler
+from doc_converter.utils.file_handler import FileHandler
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """
+    A directory tree with nested files, a directory named like a file,
+    upper-case and symlinked entries::
+
+        a.pdf  b.docx  c.txt  notes.PDF  folder.pdf/inner.txt
+        link.pdf -> sub/d.pdf  broken.pdf -> missing.pdf  linkdir -> sub
+        sub/d.pdf  sub/deep/e.docx
+    """
+    for name in ("a.pdf", "b.docx", "c.txt", "notes.PDF"):
+        (tmp_path / name).write_bytes(b"data")
+    (tmp_path / "folder.pdf").mkdir()
+    (tmp_path / "folder.pdf" / "inner.txt").write_bytes(b"data")
+    (tmp_path / "sub" / "deep").mkdir(parents=True)
+    (tmp_path / "sub" / "d.pdf").write_bytes(b"data")
+    (tmp_path / "sub" / "deep" / "e.docx").write_bytes(b"data")
+    os.symlink(tmp_path / "sub" / "d.pdf", tmp_path / "link.pdf")
+    os.symlink(tmp_path / "missing.pdf", tmp_path / "broken.pdf")
+    os.symlink(tmp_path / "sub", tmp_path / "linkdir")
+    return tmp_path
+
+
+def relative(paths, root):
+    """Paths relative to root, with '/' separators, in order."""
+    return [os.path.relpath(path, root).replace(os.sep, "/") for path in paths]
+
+
+class TestFindFiles:
+
+    def test_recursive_multiple_patterns(self, tree):
+        """Test one walk finds files matching any of several patterns."""
+        result = FileHandler.find_files(tree, ["*.pdf", "*.docx"])
+
+        # Directories named like files, dangling links, files inside
+        # symlinked directories and differently cased names don't match
+        assert relative(result, tree) == [
+            "a.pdf",
+            "b.docx",
+            "link.pdf",
+            "sub/d.pdf",
+            "sub/deep/e.docx",
+        ]
+
+    def test_recursive_path_pattern(self, tree):
+        """Test patterns with '/' match the relative path at any depth."""
+        assert relative(
+            FileHandler.find_files(tree, ["sub/*.pdf", "deep/*"]), tree
+        ) == ["sub/d.pdf", "sub/deep/e.docx"]
+
+    def test_case_sensitive(self, tree):
+        """Test patterns match names case-sensitively."""
+        assert relative(FileHandler.find_files(tree, ["*.PDF"]), tree) == ["notes.PDF"]
+
+    def test_directory_name_not_matched(self, tree):
+        """Test a directory whose name fits a pattern is not returned."""
+        assert relative(FileHandler.find_files(tree, ["folder*"]), tree) == []
+        assert relative(FileHandler.find_files(tree, ["inner.txt"]), tree) == [
+            "folder.pdf/inner.txt"
+        ]
+
+    def test_flat_literal_patterns(self, tree):
+        """Test wildcard-free patterns are checked without listing."""
+        patterns = [
+            "a.pdf",
+            "sub/d.pdf",
+            "folder.pdf",
+            "broken.pdf",
+            "missing.pdf",
+            "sub/missing/x.pdf",
+        ]
+
+        with patch("doc_converter.utils.file_handler.os.scandir") as mock_scandir:
+            result = FileHandler.find_files(tree, patterns, recursive=False)
+
+        mock_scandir.assert_not_called()
+        assert relative(result, tree) == ["a.pdf", "sub/d.pdf"]
+
+    def test_flat_wildcard_patterns(self, tree):
+        """Test each directory named by wildcard patterns is listed once."""
+        patterns = ["*.pdf", "*.docx", "a.*", "sub/*.pdf", "linkdir/*.pdf"]
+
+        with patch(
+            "doc_converter.utils.file_handler.os.scandir", side_effect=os.scandir
+        ) as mock_scandir:
+            result = FileHandler.find_files(tree, patterns, recursive=False)
+
+        assert mock_scandir.call_count == 3
+        assert relative(result, tree) == [
+            "a.pdf",
+            "b.docx",
+            "link.pdf",
+            "linkdir/d.pdf",
+            "sub/d.pdf",
+        ]
+
+    def test_flat_deep_wildcards(self, tree):
+        """Test wildcards above the last component fall back to glob."""
+        result = FileHandler.find_files(tree, ["*/*.docx", "s*/*/*"], recursive=False)
+
+        assert relative(result, tree) == ["sub/deep/e.docx"]
+
+    @pytest.mark.parametrize("recursive", [True, False])
+    def test_iter_files(self, tree, recursive):
+        """Test iter_files lazily yields each matching path once."""
+        files = FileHandler.iter_files(tree, ["*.pdf", "a.*"], recursive)
+
+        assert iter(files) is files
+        paths = list(files)
+        assert all(isinstance(path, str) for path in paths)
+        assert len(paths) == len(set(paths))
+        expected = ["a.pdf", "link.pdf"] + (["sub/d.pdf"] if recursive else [])
+        assert sorted(relative(paths, tree)) == expected
+
+    def test_walk_files_skips_symlinked_directories(self, tree):
+        """Test the walk lists symlinked files but not linked directories."""
+        names = sorted(entry.name for entry in FileHandler.walk_files(tree))
+
+        assert names == [
+            "a.pdf",
+            "b.docx",
+            "c.txt",
+            "d.pdf",
+            "e.docx",
+            "inner.txt",
+            "link.pdf",
+            "notes.PDF",
+        ]
+
+
+class TestFastCopy:
+
+    @pytest.fixture(params=["linux", "darwin"])
+    def platform(self, request):
+        """Run on both the kernel copy path and the shutil path."""
+        with patch.object(file_handler.sys, "platform", request.param):
+            yield request.param
+
+    def test_exclusive_copy(self, platform, tmp_path):
+        """Test an exclusive copy writes the data and keeps existing files."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"data" * 1000)
+        dst = tmp_path / "dst.bin"
+
+        FileHandler._fastcopy(src, dst, exclusive=True)
+        assert dst.read_bytes() == src.read_bytes()
+
+        with pytest.raises(FileExistsError):
+            FileHandler._fastcopy(src, dst, exclusive=True)
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_exclusive_copy_missing_source(self, platform, tmp_path):
+        """Test a failed exclusive copy leaves no destination behind."""
+        dst = tmp_path / "dst.bin"
+
+        with pytest.raises(FileNotFoundError):
+            FileHandler._fastcopy(tmp_path / "missing.bin", dst, exclusive=True)
+
+        assert not dst.exists()
+
+
+class TestMoveFile:
+
+    def test_move_across_filesystems(self, tmp_path):
+        """Test a move falls back to copy and unlink across devices."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"data" * 1000)
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        dst = tmp_path / "out" / "dst.bin"
+
+        with patch(
+            "doc_converter.utils.file_handler.os.replace",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ) as mock_replace:
+            result = FileHandler.move_file(src, dst)
+
+        assert mock_replace.called
+        assert result == dst
+        assert dst.read_bytes() == b"data" * 1000
+        assert dst.stat().st_mtime == 1_000_000_000
+        assert not src.exists()
+
+    def test_move_other_error(self, tmp_path):
+        """Test errors other than EXDEV are raised without copying."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"data")
+        dst = tmp_path / "dst.bin"
+
+        with patch(
+            "doc_converter.utils.file_handler.os.replace",
+            side_effect=PermissionError(errno.EACCES, "Permission denied"),
+        ):
+            with pytest.raises(PermissionError):
+                FileHandler.move_file(src, dst)
+
+        assert src.exists()
+        assert not dst.exists()
@@ -0,0 +1,109 @@
+"""
+Tests for HTML converter functionality.
+"""
+
+import shlex
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from doc_converter.core.html_converter import HTMLConverter
+
+
+def fake_wkhtmltopdf(failing=()):
+    """Stand-in for subprocess.run writing the PDFs of a stdin batch."""
+
+    def run(cmd, input, **kwargs):
+        returncode = 0
+        for line in input.splitlines():
+            # Lines are quoted like shell arguments
+            _, output_path = shlex.split(line)
+            if Path(output_path).name in failing:
+                returncode = 1
+            else:
+                Path(output_path).write_bytes(b"%PDF-1.4")
+        stderr = "Error: Failed loading page" if returncode else ""
+        return Mock(returncode=returncode, stdout="", stderr=stderr)
+
+    return run
+
+
+class TestHTMLConverter:
+
+    @pytest.fixture
+    def converter(self):
+        """Create an HTMLConverter with a known wkhtmltopdf path."""
+        converter = HTMLConverter()
+        converter.wkhtmltopdf_path = "wkhtmltopdf"
+        return converter
+
+    @pytest.fixture
+    def html_dir(self, tmp_path):
+        """Directory with HTML files, one of them with a space in its name."""
+        html_dir = tmp_path / "my pages"
+        html_dir.mkdir()
+        for name in ("a.html", "b c.html"):
+            (html_dir / name).write_text("<p>page</p>")
+        return html_dir
+
+    @patch("subprocess.run")
+    def test_batch_to_pdf_stdin(self, mock_run, converter, html_dir, tmp_path):
+        """Test one wkhtmltopdf run reads a quoted line per conversion."""
+        mock_run.side_effect = fake_wkhtmltopdf()
+        out_dir = tmp_path / "out dir"
+        pairs = [
+            (str(html_dir / "a.html"), out_dir / "a.pdf"),
+            (str(html_dir / "b c.html"), out_dir / "b c.pdf"),
+            ("https://example.com/?q=1", out_dir / 'say "hi".pdf'),
+        ]
+
+        result = converter.batch_to_pdf(pairs)
+
+        assert result == [str(output_path) for _, output_path in pairs]
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[0] == "wkhtmltopdf"
+        assert cmd[-1] == "--read-args-from-stdin"
+        assert mock_run.call_args.kwargs["input"] == (
+            f'"{html_dir}/a.html" "{out_dir}/a.pdf"\n'
+            f'"{html_dir}/b c.html" "{out_dir}/b c.pdf"\n'
+            f'"https://example.com/?q=1" "{out_dir}/say \\"hi\\".pdf"\n'
+        )
+
+    @patch("subprocess.run")
+    def test_batch_to_pdf_one_fails(self, mock_run, converter, html_dir, tmp_path):
+        """Test a failed conversion names the PDFs that were not written."""
+        mock_run.side_effect = fake_wkhtmltopdf(failing={"b c.pdf"})
+        pairs = [
+            (str(html_dir / "a.html"), tmp_path / "a.pdf"),
+            (str(html_dir / "b c.html"), tmp_path / "b c.pdf"),
+        ]
+
+        with pytest.raises(RuntimeError) as excinfo:
+            converter.batch_to_pdf(pairs)
+
+        missing = tmp_path / "b c.pdf"
+        assert str(excinfo.value) == f"PDF was not created: {missing}"
+        assert (tmp_path / "a.pdf").exists()
+
+    @patch("subprocess.run")
+    def test_batch_to_pdf_missing_input(self, mock_run, converter, tmp_path):
+        """Test a missing HTML file is reported before wkhtmltopdf runs."""
+        pairs = [(str(tmp_path / "missing.html"), tmp_path / "missing.pdf")]
+
+        with pytest.raises(FileNotFoundError):
+            converter.batch_to_pdf(pairs)
+
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_batch_to_pdf_timeout(self, mock_run, converter, html_dir, tmp_path):
+        """Test a batch that runs too long is reported as a timeout."""
+        mock_run.side_effect = subprocess.TimeoutExpired(
+            cmd=["wkhtmltopdf"], timeout=300
+        )
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            converter.batch_to_pdf([(str(html_dir / "a.html"), tmp_path / "a.pdf")])
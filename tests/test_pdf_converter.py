@@ -2,20 +2,71 @@
 Tests for PDF converter functionality.
 """
 
+import asyncio
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
+from PyPDF2 import PageObject
 
-from doc_converter.core.pdf_converter import PDFConverter
+from doc_converter.core.pdf_converter import (
+    PDFConverter,
+    _cached_page_count,
+    _load_pdfium,
+    _page_cache,
+)
+from doc_converter.utils.config import Config
+
+
+def fake_render(
+    pdf_path, dpi, first_page, last_page, output_folder, paths_only, fmt="ppm", **kwargs
+):
+    """Stand-in for convert_from_path writing one scratch file per page."""
+    paths = []
+    for page in range(first_page or 1, (last_page or 2) + 1):
+        path = Path(output_folder) / f"page-{page}.{fmt}"
+        path.touch()
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture(autouse=True)
+def reset_module_caches():
+    """Keep page counts and pages cached by one test out of the next."""
+    yield
+    _cached_page_count.cache_clear()
+    _page_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def real_pdf(tmp_path_factory):
+    """A small two-page A4 PDF, generated once per test session."""
+    from fpdf import FPDF
+
+    pdf = FPDF(format="A4")
+    pdf.set_font("Helvetica", size=24)
+    for text in ("First page", "Second page"):
+        pdf.add_page()
+        pdf.cell(0, 20, text)
+
+    path = tmp_path_factory.mktemp("pdfs") / "real.pdf"
+    pdf.output(str(path))
+    return path
 
 
 class TestPDFConverter:
 
     @pytest.fixture
     def converter(self):
-        """Create a PDFConverter instance for testing."""
-        return PDFConverter()
+        """Create a PDFConverter rendering with poppler for testing."""
+        with patch(
+            "doc_converter.core.pdf_converter._load_pdfium", return_value=None
+        ):
+            yield PDFConverter()
 
     @pytest.fixture
     def sample_pdf_path(self):
@@ -24,8 +75,10 @@ class TestPDFConverter:
 
     @pytest.fixture
     def output_dir(self, tmp_path):
-        """Temporary output directory."""
-        return tmp_path / "images"
+        """Temporary output directory, already created."""
+        output_dir = tmp_path / "images"
+        output_dir.mkdir()
+        return output_dir
 
     def test_converter_initialization(self, converter):
         """Test PDFConverter initialization."""
@@ -34,60 +87,429 @@ class TestPDFConverter:
 
     def test_converter_with_config(self):
         """Test PDFConverter initialization with config."""
-        mock_config = Mock()
+        mock_config = Mock(spec=Config)
         converter = PDFConverter(mock_config)
         assert converter.config == mock_config
 
-    @patch("doc_converter.core.pdf_converter.convert_from_path")
+    @patch("pdf2image.convert_from_path")
     def test_to_images_success(
         self, mock_convert, converter, sample_pdf_path, output_dir
     ):
         """Test successful PDF to images conversion."""
         # Mock the pdf2image conversion
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image, mock_image]
-
-        # Create output directory
-        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_convert.side_effect = fake_render
 
         result = converter.to_images(
             pdf_path=sample_pdf_path,
             output_dir=output_dir,
             format="jpeg",
             dpi=200,
+            thread_count=1,
         )
 
         # Verify conversion was called with correct parameters
         mock_convert.assert_called_once_with(
-            sample_pdf_path, dpi=200, first_page=None, last_page=None
+            sample_pdf_path,
+            dpi=200,
+            first_page=None,
+            last_page=None,
+            output_folder=ANY,
+            paths_only=True,
+            fmt="jpeg",
+            jpegopt={"quality": 95, "optimize": "y", "progressive": "y"},
+        )
+
+        # Verify poppler's pages were moved into place and the scratch
+        # directory removed
+        assert result == [
+            str(output_dir / "page_001.jpeg"),
+            str(output_dir / "page_002.jpeg"),
+        ]
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "page_001.jpeg",
+            "page_002.jpeg",
+        ]
+
+    @patch("PIL.Image.open")
+    @patch("pdf2image.pdfinfo_from_path")
+    @patch("pdf2image.convert_from_path")
+    def test_to_images_reencodes_other_formats(
+        self,
+        mock_convert,
+        mock_pdfinfo,
+        mock_open_image,
+        converter,
+        sample_pdf_path,
+        output_dir,
+    ):
+        """Test formats poppler cannot write are re-encoded with PIL."""
+        mock_pdfinfo.return_value = {"Pages": 12}
+        mock_convert.side_effect = fake_render
+
+        result = converter.to_images(
+            pdf_path=sample_pdf_path,
+            output_dir=output_dir,
+            format="tiff",
+            thread_count=1,
+        )
+
+        assert "fmt" not in mock_convert.call_args.kwargs
+        # Scratch pages are rendered in bounded batches
+        assert [
+            (call.kwargs["first_page"], call.kwargs["last_page"])
+            for call in mock_convert.call_args_list
+        ] == [(1, 10), (11, 12)]
+        mock_open_image.return_value.__enter__.return_value.save.assert_called_with(
+            output_dir / "page_012.tiff", "TIFF"
+        )
+        assert len(result) == 12
+        assert list(output_dir.iterdir()) == []
+
+    @patch("pdf2image.pdfinfo_from_path")
+    @patch("pdf2image.convert_from_path")
+    def test_to_images_parallel_chunks(
+        self,
+        mock_convert,
+        mock_pdfinfo,
+        converter,
+        sample_pdf_path,
+        output_dir,
+    ):
+        """Test long PDFs are rendered in contiguous page chunks."""
+        mock_pdfinfo.return_value = {"Pages": 16}
+        mock_convert.side_effect = fake_render
+
+        result = converter.to_images(
+            pdf_path=sample_pdf_path,
+            output_dir=output_dir,
+            thread_count=4,
+        )
+
+        # No chunk is shorter than eight pages
+        assert sorted(
+            (call.kwargs["first_page"], call.kwargs["last_page"])
+            for call in mock_convert.call_args_list
+        ) == [(1, 8), (9, 16)]
+        assert result == [
+            str(output_dir / f"page_{page:03d}.jpeg") for page in range(1, 17)
+        ]
+
+    @patch("pdf2image.pdfinfo_from_path")
+    @patch("pdf2image.convert_from_path")
+    def test_to_images_short_pdf_one_piece(
+        self,
+        mock_convert,
+        mock_pdfinfo,
+        converter,
+        sample_pdf_path,
+        output_dir,
+    ):
+        """Test short PDFs are rendered without splitting them."""
+        mock_pdfinfo.return_value = {"Pages": 4}
+        mock_convert.side_effect = fake_render
+
+        with patch(
+            "doc_converter.core.pdf_converter.ThreadPoolExecutor"
+        ) as mock_pool:
+            converter.to_images(
+                pdf_path=sample_pdf_path,
+                output_dir=output_dir,
+                thread_count=4,
+            )
+
+        mock_pool.assert_not_called()
+        mock_convert.assert_called_once()
+
+    @patch("pdf2image.convert_from_path")
+    def test_to_images_filenames_zero_padded(
+        self, mock_convert, converter, sample_pdf_path, output_dir
+    ):
+        """Test file names are padded to the widest page number."""
+        mock_convert.side_effect = fake_render
+
+        result = converter.to_images(
+            pdf_path=sample_pdf_path,
+            output_dir=output_dir,
+            first_page=985,
+            last_page=1000,
+            thread_count=2,
+        )
+
+        # The first chunk ends at page 992, yet both pad to four digits
+        assert mock_convert.call_count == 2
+        assert result == [
+            str(output_dir / f"page_{page:04d}.jpeg")
+            for page in range(985, 1001)
+        ]
+        assert result == sorted(result)
+
+    @patch("pdf2image.convert_from_path")
+    def test_to_images_page_cache_hit(
+        self, mock_convert, converter, tmp_path
+    ):
+        """Test pages rendered before are written from the page cache."""
+        mock_convert.side_effect = fake_render
+        converter.config = Config()
+        converter.config.set("output.page_cache", True)
+        pdf_path = tmp_path / "cached.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 cached")
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+
+        first = converter.to_images(
+            pdf_path, first_dir, first_page=1, last_page=2, thread_count=1
+        )
+        second = converter.to_images(
+            pdf_path, second_dir, first_page=1, last_page=2, thread_count=1
+        )
+        converter.to_images(
+            pdf_path,
+            tmp_path,
+            dpi=100,
+            first_page=1,
+            last_page=2,
+            thread_count=1,
+        )
+
+        # Only the change of DPI renders again
+        assert mock_convert.call_count == 2
+        assert second == [
+            str(second_dir / "page_001.jpeg"),
+            str(second_dir / "page_002.jpeg"),
+        ]
+        for first_path, second_path in zip(first, second):
+            assert (
+                Path(first_path).read_bytes() == Path(second_path).read_bytes()
+            )
+
+    @patch("pdf2image.convert_from_path")
+    def test_to_images_page_cache_off(
+        self, mock_convert, converter, sample_pdf_path, output_dir
+    ):
+        """Test pages are not read back into the cache by default."""
+        mock_convert.side_effect = fake_render
+        converter.config = Config()
+
+        with patch.object(_page_cache, "add_file") as mock_add_file:
+            for _ in range(2):
+                converter.to_images(
+                    sample_pdf_path, output_dir, last_page=2, thread_count=1
+                )
+
+        mock_add_file.assert_not_called()
+        assert mock_convert.call_count == 2
+
+    @patch("doc_converter.core.pdf_converter._load_pdfium")
+    def test_to_images_pdfium(
+        self, mock_load_pdfium, sample_pdf_path, output_dir
+    ):
+        """Test pages are rendered in-process when pypdfium2 is installed."""
+        pdf = MagicMock()
+        pdf.__len__.return_value = 2
+        mock_load_pdfium.return_value.PdfDocument.return_value = pdf
+        page = pdf.__getitem__.return_value
+        image = page.render.return_value.to_pil.return_value
+
+        result = PDFConverter().to_images(
+            pdf_path=sample_pdf_path,
+            output_dir=output_dir,
+            dpi=144,
+            thread_count=1,
+        )
+
+        page.render.assert_called_with(
+            scale=2.0, grayscale=False, rev_byteorder=True
+        )
+        image.save.assert_called_with(
+            output_dir / "page_002.jpeg",
+            "JPEG",
+            quality=95,
+            optimize=True,
+            progressive=True,
+        )
+        assert result == [
+            str(output_dir / "page_001.jpeg"),
+            str(output_dir / "page_002.jpeg"),
+        ]
+        pdf.close.assert_called_once_with()
+
+    @patch("doc_converter.core.pdf_converter._load_simplejpeg")
+    @patch("doc_converter.core.pdf_converter._load_pdfium")
+    def test_to_images_pdfium_simplejpeg(
+        self, mock_load_pdfium, mock_load_simplejpeg, sample_pdf_path, tmp_path
+    ):
+        """Test baseline JPEG pages are encoded with simplejpeg."""
+        pdf = MagicMock()
+        pdf.__len__.return_value = 1
+        mock_load_pdfium.return_value.PdfDocument.return_value = pdf
+        bitmap = pdf.__getitem__.return_value.render.return_value
+        bitmap.mode = "RGB"
+        pixels = bitmap.to_numpy.return_value
+        pixels.shape = (20, 10, 3)
+        encode_jpeg = mock_load_simplejpeg.return_value.encode_jpeg
+        encode_jpeg.return_value = b"\xff\xd8jpeg"
+
+        config = Config()
+        config.set("output.jpeg_optimize", False)
+        config.set("output.jpeg_progressive", False)
+
+        result = PDFConverter(config).to_images(
+            pdf_path=sample_pdf_path, output_dir=tmp_path, thread_count=1
+        )
+
+        pixels.reshape.assert_called_once_with(20, 10, -1)
+        encode_jpeg.assert_called_once_with(
+            pixels.reshape.return_value,
+            quality=95,
+            colorspace="RGB",
+            colorsubsampling="420",
+        )
+        bitmap.to_pil.assert_not_called()
+        assert result == [str(tmp_path / "page_001.jpeg")]
+        assert (tmp_path / "page_001.jpeg").read_bytes() == b"\xff\xd8jpeg"
+
+    @patch("doc_converter.core.pdf_converter.ProcessPoolExecutor")
+    @patch("doc_converter.core.pdf_converter._load_pdfium")
+    def test_to_images_pdfium_parallel(
+        self, mock_load_pdfium, mock_pool, sample_pdf_path, output_dir
+    ):
+        """Test PDFium chunks each open their own document."""
+        mock_pool.side_effect = lambda max_workers, mp_context: (
+            ThreadPoolExecutor(max_workers)
+        )
+        pdf = MagicMock()
+        pdf.__len__.return_value = 16
+        mock_load_pdfium.return_value.PdfDocument.return_value = pdf
+
+        result = PDFConverter().to_images(
+            pdf_path=sample_pdf_path, output_dir=output_dir, thread_count=2
         )
 
-        # Verify images were saved
-        mock_image.save.assert_called()
-        assert len(result) == 2
+        # Workers are never forked from a process that may have threads
+        # inside PDFium
+        mp_context = mock_pool.call_args.kwargs["mp_context"]
+        assert mp_context.get_start_method() != "fork"
+        # One document to count the pages, then one per chunk
+        assert mock_load_pdfium.return_value.PdfDocument.call_count == 3
+        assert sorted(
+            call.args[0] for call in pdf.__getitem__.call_args_list
+        ) == list(range(16))
+        assert result == [
+            str(output_dir / f"page_{page:03d}.jpeg") for page in range(1, 17)
+        ]
 
+    @pytest.mark.parametrize(
+        "dpi,format", [(72, "jpeg"), (150, "png"), (300, "webp")]
+    )
+    def test_to_images_real_render(self, real_pdf, tmp_path, dpi, format):
+        """Test rendering a real PDF with whichever renderer is installed."""
+        if _load_pdfium() is None and shutil.which("pdftoppm") is None:
+            pytest.skip("needs pypdfium2 or poppler")
+        from PIL import Image
+
+        result = PDFConverter().to_images(
+            pdf_path=real_pdf,
+            output_dir=tmp_path,
+            format=format,
+            dpi=dpi,
+            thread_count=1,
+        )
+
+        assert result == [
+            str(tmp_path / f"page_{page:03d}.{format}") for page in (1, 2)
+        ]
+        with Image.open(result[0]) as image:
+            assert image.format == format.upper()
+            # A4 is 595.28 points (1/72 inch) wide
+            assert abs(image.width - 595.28 * dpi / 72) <= 1
+
+    def test_gather_to_images_bounded(self, converter, tmp_path):
+        """Test several PDFs convert concurrently within the limit."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def fake_to_images(pdf_path, output_dir, **kwargs):
+            with lock:
+                running.append(pdf_path)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(pdf_path)
+            return [str(output_dir / "page_001.jpeg")]
+
+        inputs = [tmp_path / f"doc{i}.pdf" for i in range(5)]
+        with patch.object(converter, "to_images", side_effect=fake_to_images):
+            result = asyncio.run(
+                converter.gather_to_images(inputs, tmp_path, concurrency=2)
+            )
+
+        assert max(peak) == 2
+        assert result == [
+            [str(tmp_path / f"doc{i}" / "page_001.jpeg")] for i in range(5)
+        ]
+
+    def test_gather_to_images_duplicate_stems(self, converter, tmp_path):
+        """Test inputs sharing a stem are rejected before converting."""
+        inputs = [
+            tmp_path / "a" / "report.pdf",
+            tmp_path / "b" / "Report.pdf",
+        ]
+
+        with patch.object(converter, "to_images") as mock_to_images:
+            with pytest.raises(ValueError, match="report.pdf"):
+                asyncio.run(converter.gather_to_images(inputs, tmp_path))
+
+        mock_to_images.assert_not_called()
+        assert not (tmp_path / "report").exists()
+
+    def test_gather_to_images_real_render(self, real_pdf, tmp_path):
+        """Test concurrent conversions of real PDFs share PDFium safely."""
+        if _load_pdfium() is None:
+            pytest.skip("needs pypdfium2")
+
+        inputs = []
+        for i in range(24):
+            pdf_path = tmp_path / f"doc{i}.pdf"
+            shutil.copyfile(real_pdf, pdf_path)
+            inputs.append(pdf_path)
+
+        result = asyncio.run(
+            PDFConverter().gather_to_images(
+                inputs, tmp_path / "out", dpi=72, concurrency=8
+            )
+        )
+
+        assert result == [
+            [
+                str(tmp_path / "out" / f"doc{i}" / f"page_{page:03d}.jpeg")
+                for page in (1, 2)
+            ]
+            for i in range(24)
+        ]
+
+    @patch("pdf2image.convert_from_path")
     def test_to_images_invalid_format(
-        self, converter, sample_pdf_path, output_dir
+        self, mock_convert, converter, sample_pdf_path, output_dir
     ):
         """Test PDF to images conversion with invalid format."""
-        with pytest.raises(
-            Exception
-        ):  # Should raise some exception for invalid format
+        with pytest.raises(ValueError, match="Unsupported format"):
             converter.to_images(
                 pdf_path=sample_pdf_path,
                 output_dir=output_dir,
                 format="invalid_format",
             )
 
-    @patch("doc_converter.core.pdf_converter.convert_from_path")
+        mock_convert.assert_not_called()
+
+    @patch("pdf2image.convert_from_path")
     def test_to_images_with_page_range(
         self, mock_convert, converter, sample_pdf_path, output_dir
     ):
         """Test PDF to images conversion with specific page range."""
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image]
-
-        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_convert.side_effect = fake_render
 
         converter.to_images(
             pdf_path=sample_pdf_path,
@@ -97,39 +519,86 @@ class TestPDFConverter:
         )
 
         mock_convert.assert_called_once_with(
-            sample_pdf_path, dpi=200, first_page=1, last_page=1
+            sample_pdf_path,
+            dpi=200,
+            first_page=1,
+            last_page=1,
+            output_folder=ANY,
+            paths_only=True,
+            fmt="jpeg",
+            jpegopt={"quality": 95, "optimize": "y", "progressive": "y"},
         )
 
-    @patch("PyPDF2.PdfReader")
+    @patch("pdf2image.pdfinfo_from_path")
     def test_get_page_count_success(
-        self, mock_pdf_reader, converter, sample_pdf_path
+        self, mock_pdfinfo, converter, sample_pdf_path
     ):
         """Test getting page count from PDF."""
-        mock_reader = Mock()
-        mock_reader.pages = [Mock(), Mock(), Mock()]  # 3 pages
-        mock_pdf_reader.return_value = mock_reader
+        mock_pdfinfo.return_value = {"Pages": 3}
 
         count = converter.get_page_count(sample_pdf_path)
 
         assert count == 3
-        mock_pdf_reader.assert_called_once_with(str(sample_pdf_path))
+        mock_pdfinfo.assert_called_once_with(str(sample_pdf_path))
+
+    @patch("pdf2image.pdfinfo_from_path")
+    def test_get_page_count_linearized(
+        self, mock_pdfinfo, converter, tmp_path
+    ):
+        """Test linearized PDFs are counted from their header alone."""
+        mock_pdfinfo.return_value = {"Pages": 5}
+        pdf_path = tmp_path / "linearized.pdf"
+        header = b"%PDF-1.4\n1 0 obj\n<< /Linearized 1 /L 100 /N 3 >>\n"
+        pdf_path.write_bytes(header.ljust(100))
 
+        assert converter.get_page_count(pdf_path) == 3
+        mock_pdfinfo.assert_not_called()
+
+        # A length mismatch means the file was updated after linearization
+        with open(pdf_path, "ab") as f:
+            f.write(b"%%EOF\n")
+        assert converter.get_page_count(pdf_path) == 5
+
+    @patch("pdf2image.pdfinfo_from_path")
+    def test_get_page_count_cached(self, mock_pdfinfo, converter, tmp_path):
+        """Test page counts are reused until the file changes."""
+        mock_pdfinfo.return_value = {"Pages": 3}
+        pdf_path = tmp_path / "cached.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4\n")
+
+        assert converter.get_page_count(pdf_path) == 3
+        assert converter.get_page_count(str(pdf_path)) == 3
+        assert mock_pdfinfo.call_count == 1
+
+        pdf_path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+        mock_pdfinfo.return_value = {"Pages": 4}
+        assert converter.get_page_count(pdf_path) == 4
+
+    @patch("pdf2image.convert_from_path")
     @patch("PyPDF2.PdfReader")
-    @patch("doc_converter.core.pdf_converter.convert_from_path")
+    @patch("pdf2image.pdfinfo_from_path")
     def test_get_page_count_fallback(
-        self, mock_convert, mock_pdf_reader, converter, sample_pdf_path
+        self,
+        mock_pdfinfo,
+        mock_pdf_reader,
+        mock_convert,
+        converter,
+        sample_pdf_path,
     ):
         """Test getting page count with fallback method."""
-        # Make PdfReader fail
-        mock_pdf_reader.side_effect = Exception("PDF reader failed")
+        # Make pdfinfo fail
+        mock_pdfinfo.side_effect = Exception("pdfinfo failed")
 
-        # Mock fallback method
-        mock_convert.return_value = [Mock(), Mock()]  # 2 pages
+        # Mock fallback method; only the number of pages is read, so one
+        # spec'd page can repeat
+        mock_pdf_reader.return_value.pages = [Mock(spec=PageObject)] * 2
 
         count = converter.get_page_count(sample_pdf_path)
 
         assert count == 2
-        mock_convert.assert_called_once()
+        mock_pdf_reader.assert_called_once_with(str(sample_pdf_path))
+        # Pages are never rendered just to count them
+        mock_convert.assert_not_called()
 
     def test_extract_page_range(self, converter, sample_pdf_path, output_dir):
         """Test extracting specific page range."""